@@ -1,22 +1,22 @@
 import sys
 
 def parse_description(description):
-    lines = description.split("\n")
-    fields = { "Sprint": "", "Environment": "", "Date": "", "Tickets": "", "Significant Updates": "", "Bug Fixes": "" }
+    field_names = ("Sprint", "Environment", "Date", "Tickets", "Significant Updates", "Bug Fixes")
+    buffers = { field: [] for field in field_names }
 
     current_field = None
-    for line in lines:
-        if ":" in line:
-            field, value = line.split(":", 1)
-            if field in fields:
+    for line in description.split("\n"):
+        field, sep, value = line.partition(":")
+        if sep:
+            if field in buffers:
                 current_field = field
-                fields[field] = value.strip()
+                buffers[field] = [value.strip()]
             else:
                 current_field = None
         elif current_field:
-            fields[current_field] += "\n" + line.strip()
+            buffers[current_field].append(line.strip())
 
-    return fields
+    return { field: "\n".join(value_list) for field, value_list in buffers.items() }
 
 def format_changelog_entry(fields):
     return "\n".join(f"{field}: {value}" for field, value in fields.items())
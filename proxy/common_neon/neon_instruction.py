@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import logging
+import struct
 from enum import IntEnum
-from typing import Optional, List, Dict, cast
-
-from singleton_decorator import singleton
-from rlp import encode as rlp_encode
+from typing import Optional, Sequence, List, Dict, Tuple, cast
 
 from solders.system_program import CreateAccountWithSeedParams, create_account_with_seed
 
@@ -15,7 +13,6 @@ from .elf_params import ElfParams
 from .config import Config
 from .utils.eth_proto import NeonTx
 from .utils.utils import str_enum
-from .layouts import CREATE_ACCOUNT_LAYOUT
 from .solana_tx import SolTxIx, SolPubKey, SolAccountMeta
 
 
@@ -38,25 +35,56 @@ class EvmIxCode(IntEnum):
     CreateAccountV03 = 0x28             # 40
 
 
-@singleton
-class EvmIxCodeName:
-    def __init__(self):
-        self._ix_code_dict: Dict[int, str] = dict()
-        for ix_code in list(EvmIxCode):
-            self._ix_code_dict[ix_code.value] = str_enum(ix_code)
+_pack_u8 = struct.Struct('<B').pack
+_pack_u32 = struct.Struct('<I').pack
+_pack_u64 = struct.Struct('<Q').pack
+_pack_u64_into = struct.Struct('<Q').pack_into
+_unpack_u32_from = struct.Struct('<I').unpack_from
+
+
+def _ix_code_bytes(ix_code: EvmIxCode) -> bytes:
+    return _pack_u8(ix_code.value)
+
+
+_IX_TX_EXEC_FROM_DATA = _ix_code_bytes(EvmIxCode.TxExecFromData)
+_IX_TX_EXEC_FROM_ACCOUNT = _ix_code_bytes(EvmIxCode.TxExecFromAccount)
+_IX_TX_STEP_FROM_DATA = _ix_code_bytes(EvmIxCode.TxStepFromData)
+_IX_TX_STEP_FROM_ACCOUNT = _ix_code_bytes(EvmIxCode.TxStepFromAccount)
+_IX_TX_STEP_FROM_ACCOUNT_NO_CHAINID = _ix_code_bytes(EvmIxCode.TxStepFromAccountNoChainId)
+_IX_CANCEL_WITH_HASH = _ix_code_bytes(EvmIxCode.CancelWithHash)
+_IX_HOLDER_CREATE = _ix_code_bytes(EvmIxCode.HolderCreate)
+_IX_HOLDER_DELETE = _ix_code_bytes(EvmIxCode.HolderDelete)
+_IX_HOLDER_WRITE = _ix_code_bytes(EvmIxCode.HolderWrite)
+_IX_CREATE_ACCOUNT_V03 = _ix_code_bytes(EvmIxCode.CreateAccountV03)
+
+_ALT_IX_CREATE = _pack_u32(0)
+_ALT_IX_EXTEND = _pack_u32(2)
+_ALT_IX_DEACTIVATE = _pack_u32(3)
+_ALT_IX_CLOSE = _pack_u32(4)
+_ALT_IX_EXTEND_HDR_SIZE = len(_ALT_IX_EXTEND) + 8
+_PUBKEY_SIZE = 32
+
+_COMPUTE_BUDGET_IX_HEAP = b'\x01'
+_COMPUTE_BUDGET_IX_CU = b'\x02'
+
+_SYS_PROGRAM_RO_META = SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False)
+_INCINERATOR_W_META = SolAccountMeta(pubkey=INCINERATOR_ID, is_signer=False, is_writable=True)
+
+
+_IX_CODE_NAME_DICT: Dict[int, str] = {ix_code.value: str_enum(ix_code) for ix_code in EvmIxCode}
+
 
-    def get(self, ix_code: int, default=None) -> str:
-        value = self._ix_code_dict.get(ix_code, default)
-        if value is None:
-            return hex(ix_code)
-        return value
+def get_ix_code_name(ix_code: int, default: Optional[str] = None) -> str:
+    value = _IX_CODE_NAME_DICT.get(ix_code, default)
+    if value is None:
+        return hex(ix_code)
+    return value
 
 
-def create_account_layout(ether):
-    return (
-        EvmIxCode.CreateAccountV03.value.to_bytes(1, byteorder='little') +
-        CREATE_ACCOUNT_LAYOUT.build(dict(ether=ether))
-    )
+def create_account_layout(ether: bytes) -> bytes:
+    # CREATE_ACCOUNT_LAYOUT is a raw 20-byte ether field, so there is nothing to build
+    assert len(ether) == 20, f'Wrong ether length {len(ether)}'
+    return _IX_CREATE_ACCOUNT_V03 + ether
 
 
 class NeonIxBuilder:
@@ -64,16 +92,29 @@ class NeonIxBuilder:
         self._evm_program_id = config.evm_program_id
         self._operator_account = operator
         self._operator_neon_address: Optional[SolPubKey] = None
-        self._neon_account_list: List[SolAccountMeta] = []
+        self._neon_account_list: Tuple[SolAccountMeta, ...] = tuple()
         self._neon_tx: Optional[NeonTx] = None
         self._neon_tx_sig: Optional[bytes] = None
         self._msg: Optional[bytes] = None
         self._holder_msg: Optional[bytes] = None
         self._treasury_pool_index_buf: Optional[bytes] = None
+        self._tx_exec_from_data_prefix: Optional[bytes] = None
+        self._tx_exec_from_account_prefix: Optional[bytes] = None
+        self._tx_step_from_data_prefix: Optional[bytes] = None
+        self._tx_step_from_account_prefix: Optional[bytes] = None
+        self._tx_step_from_account_no_chainid_prefix: Optional[bytes] = None
         self._treasury_pool_address: Optional[SolPubKey] = None
         self._holder: Optional[SolPubKey] = None
         self._elf_params = ElfParams()
 
+        self._evm_program_ro_meta = SolAccountMeta(pubkey=self._evm_program_id, is_signer=False, is_writable=False)
+        self._operator_w_meta = SolAccountMeta(pubkey=operator, is_signer=True, is_writable=True)
+        self._operator_ro_meta = SolAccountMeta(pubkey=operator, is_signer=True, is_writable=False)
+        self._operator_neon_w_meta: Optional[SolAccountMeta] = None
+        self._treasury_pool_w_meta: Optional[SolAccountMeta] = None
+        self._holder_w_meta: Optional[SolAccountMeta] = None
+        self._holder_account_list: Optional[Tuple[SolAccountMeta, ...]] = None
+
     @property
     def evm_program_id(self) -> SolPubKey:
         return self._evm_program_id
@@ -89,34 +130,64 @@ class NeonIxBuilder:
 
     def init_operator_neon(self, operator_ether: NeonAddress) -> NeonIxBuilder:
         self._operator_neon_address = neon_2program(self.evm_program_id, operator_ether)[0]
+        self._operator_neon_w_meta = SolAccountMeta(
+            pubkey=self._operator_neon_address, is_signer=False, is_writable=True
+        )
+        self._holder_account_list = None
         return self
 
     def init_neon_tx(self, neon_tx: NeonTx) -> NeonIxBuilder:
         self._neon_tx = neon_tx
 
-        self._msg = rlp_encode(self._neon_tx)
+        self._msg = neon_tx.rlp_msg
         self._holder_msg = self._msg
-        return self.init_neon_tx_sig(self._neon_tx.hex_tx_sig)
+        return self._init_neon_tx_sig(neon_tx.tx_sig)
 
     def init_neon_tx_sig(self, neon_tx_sig: str) -> NeonIxBuilder:
-        self._neon_tx_sig = bytes.fromhex(neon_tx_sig[2:])
-        treasury_pool_index = int().from_bytes(self._neon_tx_sig[:4], 'little') % ElfParams().treasury_pool_max
-        self._treasury_pool_index_buf = treasury_pool_index.to_bytes(4, 'little')
+        if neon_tx_sig[:2] in {'0x', '0X'}:
+            neon_tx_sig = neon_tx_sig[2:]
+        return self._init_neon_tx_sig(bytes.fromhex(neon_tx_sig))
+
+    def _init_neon_tx_sig(self, neon_tx_sig: bytes) -> NeonIxBuilder:
+        self._neon_tx_sig = neon_tx_sig
+        treasury_pool_max = self._elf_params.treasury_pool_max
+        treasury_pool_index = _unpack_u32_from(neon_tx_sig)[0] % treasury_pool_max
+        self._treasury_pool_index_buf = _pack_u32(treasury_pool_index)
+        self._tx_exec_from_data_prefix = _IX_TX_EXEC_FROM_DATA + self._treasury_pool_index_buf
+        self._tx_exec_from_account_prefix = _IX_TX_EXEC_FROM_ACCOUNT + self._treasury_pool_index_buf
+        self._tx_step_from_data_prefix = _IX_TX_STEP_FROM_DATA + self._treasury_pool_index_buf
+        self._tx_step_from_account_prefix = _IX_TX_STEP_FROM_ACCOUNT + self._treasury_pool_index_buf
+        self._tx_step_from_account_no_chainid_prefix = (
+            _IX_TX_STEP_FROM_ACCOUNT_NO_CHAINID + self._treasury_pool_index_buf
+        )
         self._treasury_pool_address = SolPubKey.find_program_address(
             [b'treasury_pool', self._treasury_pool_index_buf],
             self._evm_program_id
         )[0]
+        self._treasury_pool_w_meta = SolAccountMeta(
+            pubkey=self._treasury_pool_address, is_signer=False, is_writable=True
+        )
+        self._holder_account_list = None
 
         return self
 
     def init_neon_account_list(self, neon_account_list: List[SolAccountMeta]) -> NeonIxBuilder:
-        self._neon_account_list = neon_account_list
+        self._neon_account_list = tuple(neon_account_list)
+        self._holder_account_list = None
         return self
 
     def init_iterative(self, holder: SolPubKey):
         self._holder = holder
+        self._holder_w_meta = SolAccountMeta(pubkey=holder, is_signer=False, is_writable=True)
+        self._holder_account_list = None
         return self
 
+    def _make_evm_ix(self, data: bytes, account_list: Sequence[SolAccountMeta]) -> SolTxIx:
+        return SolTxIx(self._evm_program_id, data, account_list)
+
+    def _concat_neon_account_list(self, meta_list: Tuple[SolAccountMeta, ...]) -> Tuple[SolAccountMeta, ...]:
+        return meta_list + self._neon_account_list
+
     def make_create_account_with_seed_ix(self, account: SolPubKey, seed: bytes, lamports: int, space: int) -> SolTxIx:
         seed_str = str(seed, 'utf8')
         LOG.debug(f'createAccountWithSeedIx {self._operator_account} account({account} seed({seed_str})')
@@ -135,24 +206,22 @@ class NeonIxBuilder:
 
     def make_delete_holder_ix(self, holder_account: SolPubKey) -> SolTxIx:
         LOG.debug(f'deleteHolderIx {self._operator_account} refunded account({holder_account})')
-        return SolTxIx(
-            accounts=[
+        return self._make_evm_ix(
+            _IX_HOLDER_DELETE,
+            [
                 SolAccountMeta(pubkey=holder_account, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-            ],
-            program_id=self._evm_program_id,
-            data=EvmIxCode.HolderDelete.value.to_bytes(1, byteorder='little'),
+                self._operator_w_meta,
+            ]
         )
 
     def create_holder_ix(self, holder: SolPubKey) -> SolTxIx:
         LOG.debug(f'createHolderIx {self._operator_account} account({holder})')
-        return SolTxIx(
-            accounts=[
+        return self._make_evm_ix(
+            _IX_HOLDER_CREATE,
+            [
                 SolAccountMeta(pubkey=holder, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-            ],
-            program_id=self._evm_program_id,
-            data=EvmIxCode.HolderCreate.value.to_bytes(1, byteorder='little'),
+                self._operator_w_meta,
+            ]
         )
 
     def make_create_neon_account_ix(self, neon_address: NeonAddress) -> SolTxIx:
@@ -162,188 +231,171 @@ class NeonIxBuilder:
         LOG.debug(f'Create neon account: {str(neon_address)}, sol account: {pda_account}, nonce: {nonce}')
 
         data = create_account_layout(bytes(neon_address))
-        return SolTxIx(
-            program_id=self._evm_program_id,
-            data=data,
-            accounts=[
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-                SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+        return self._make_evm_ix(
+            data,
+            [
+                self._operator_w_meta,
+                _SYS_PROGRAM_RO_META,
                 SolAccountMeta(pubkey=pda_account, is_signer=False, is_writable=True),
             ])
 
     def make_write_ix(self, offset: int, data: bytes) -> SolTxIx:
-        ix_data = b''.join([
-            EvmIxCode.HolderWrite.value.to_bytes(1, byteorder='little'),
+        ix_data = b''.join((
+            _IX_HOLDER_WRITE,
             self._neon_tx_sig,
-            offset.to_bytes(8, byteorder='little'),
+            _pack_u64(offset),
             data
-        ])
-        return SolTxIx(
-            program_id=self._evm_program_id,
-            data=ix_data,
-            accounts=[
-                SolAccountMeta(pubkey=self._holder, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=False),
+        ))
+        return self._make_evm_ix(
+            ix_data,
+            [
+                self._holder_w_meta,
+                self._operator_ro_meta,
             ]
         )
 
     def make_tx_exec_from_data_ix(self) -> SolTxIx:
-        ix_data = b''.join([
-            EvmIxCode.TxExecFromData.value.to_bytes(1, byteorder='little'),
-            self._treasury_pool_index_buf,
-            self._msg
-        ])
-        return SolTxIx(
-            program_id=self._evm_program_id,
-            data=ix_data,
-            accounts=[
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-                SolAccountMeta(pubkey=self._treasury_pool_address, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_neon_address, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-                SolAccountMeta(pubkey=self._evm_program_id, is_signer=False, is_writable=False),
-            ] + self._neon_account_list
+        ix_data = self._tx_exec_from_data_prefix + self._msg
+        return self._make_evm_ix(
+            ix_data,
+            self._concat_neon_account_list((
+                self._operator_w_meta,
+                self._treasury_pool_w_meta,
+                self._operator_neon_w_meta,
+                _SYS_PROGRAM_RO_META,
+                self._evm_program_ro_meta,
+            ))
         )
 
     def make_tx_exec_from_account_ix(self) -> SolTxIx:
-        ix_data = b''.join([
-            EvmIxCode.TxExecFromAccount.value.to_bytes(1, byteorder='little'),
-            self._treasury_pool_index_buf,
-        ])
-        return self._make_holder_ix(ix_data)
+        return self._make_holder_ix(self._tx_exec_from_account_prefix)
 
     def make_cancel_ix(self) -> SolTxIx:
-        return SolTxIx(
-            program_id=self._evm_program_id,
-            data=EvmIxCode.CancelWithHash.value.to_bytes(1, byteorder='little') + self._neon_tx_sig,
-            accounts=[
-                SolAccountMeta(pubkey=self._holder, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-                SolAccountMeta(pubkey=INCINERATOR_ID, is_signer=False, is_writable=True),
-            ] + self._neon_account_list
+        return self._make_evm_ix(
+            _IX_CANCEL_WITH_HASH + self._neon_tx_sig,
+            self._concat_neon_account_list((
+                self._holder_w_meta,
+                self._operator_w_meta,
+                _INCINERATOR_W_META,
+            ))
         )
 
     def make_tx_step_from_data_ix(self, step_cnt: int, index: int) -> SolTxIx:
         return self._make_tx_step_ix(
-            EvmIxCode.TxStepFromData.value.to_bytes(1, byteorder='little'),
+            self._tx_step_from_data_prefix,
             step_cnt, index, self._msg
         )
 
-    def _make_tx_step_ix(self, ix_id_byte: bytes, neon_step_cnt: int, index: int,
+    def _make_tx_step_ix(self, ix_prefix: bytes, neon_step_cnt: int, index: int,
                          data: Optional[bytes]) -> SolTxIx:
-        ix_data = b''.join([
-            ix_id_byte,
-            self._treasury_pool_index_buf,
-            neon_step_cnt.to_bytes(4, byteorder='little'),
-            index.to_bytes(4, byteorder="little")
-        ])
-
-        if data is not None:
-            ix_data += data
+        ix_data = b''.join((
+            ix_prefix,
+            _pack_u32(neon_step_cnt),
+            _pack_u32(index),
+            data or b''
+        ))
 
         return self._make_holder_ix(ix_data)
 
+    def _get_holder_account_list(self) -> Tuple[SolAccountMeta, ...]:
+        # the same account list is used by all iterations, SolTxIx copies it on construction
+        if self._holder_account_list is None:
+            self._holder_account_list = self._concat_neon_account_list((
+                self._holder_w_meta,
+                self._operator_w_meta,
+                self._treasury_pool_w_meta,
+                self._operator_neon_w_meta,
+                _SYS_PROGRAM_RO_META,
+                self._evm_program_ro_meta,
+            ))
+        return self._holder_account_list
+
     def _make_holder_ix(self, ix_data: bytes):
-        return SolTxIx(
-            program_id=self._evm_program_id,
-            data=ix_data,
-            accounts=[
-                 SolAccountMeta(pubkey=self._holder, is_signer=False, is_writable=True),
-                 SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),
-                 SolAccountMeta(pubkey=self._treasury_pool_address, is_signer=False, is_writable=True),
-                 SolAccountMeta(pubkey=self._operator_neon_address, is_signer=False, is_writable=True),
-                 SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-                 SolAccountMeta(pubkey=self._evm_program_id, is_signer=False, is_writable=False),
-             ] + self._neon_account_list
+        return self._make_evm_ix(
+            ix_data,
+            self._get_holder_account_list()
         )
 
     def make_tx_step_from_account_ix(self, neon_step_cnt: int, index: int) -> SolTxIx:
         return self._make_tx_step_ix(
-            EvmIxCode.TxStepFromAccount.value.to_bytes(1, byteorder='little'),
+            self._tx_step_from_account_prefix,
             neon_step_cnt, index, None
         )
 
     def make_tx_step_from_account_no_chainid_ix(self, neon_step_cnt: int, index: int) -> SolTxIx:
         return self._make_tx_step_ix(
-            EvmIxCode.TxStepFromAccountNoChainId.value.to_bytes(1, byteorder='little'),
+            self._tx_step_from_account_no_chainid_prefix,
             neon_step_cnt, index, None
         )
 
     def make_create_lookup_table_ix(self, table_account: SolPubKey,
                                     recent_block_slot: int,
                                     seed: int) -> SolTxIx:
-        data = b''.join([
-            int(0).to_bytes(4, byteorder='little'),
-            recent_block_slot.to_bytes(8, byteorder='little'),
-            seed.to_bytes(1, byteorder='little')
-        ])
+        data = b''.join((
+            _ALT_IX_CREATE,
+            _pack_u64(recent_block_slot),
+            _pack_u8(seed)
+        ))
         return SolTxIx(
-            program_id=ADDRESS_LOOKUP_TABLE_ID,
-            data=data,
-            accounts=[
+            ADDRESS_LOOKUP_TABLE_ID,
+            data,
+            [
                 SolAccountMeta(pubkey=table_account, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=False),  # signer
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),   # payer
-                SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+                self._operator_ro_meta,  # signer
+                self._operator_w_meta,  # payer
+                _SYS_PROGRAM_RO_META,
             ]
         )
 
     def make_extend_lookup_table_ix(self, table_account: SolPubKey,
                                     account_list: List[SolPubKey]) -> SolTxIx:
-        data = b"".join(
-            [
-                int(2).to_bytes(4, byteorder='little'),
-                len(account_list).to_bytes(8, byteorder='little')
-            ] +
-            [bytes(pubkey) for pubkey in account_list]
-        )
+        data = bytearray(_ALT_IX_EXTEND_HDR_SIZE + _PUBKEY_SIZE * len(account_list))
+        data[:len(_ALT_IX_EXTEND)] = _ALT_IX_EXTEND
+        _pack_u64_into(data, len(_ALT_IX_EXTEND), len(account_list))
+
+        offset = _ALT_IX_EXTEND_HDR_SIZE
+        for pubkey in account_list:
+            data[offset:offset + _PUBKEY_SIZE] = bytes(pubkey)
+            offset += _PUBKEY_SIZE
 
         return SolTxIx(
-            program_id=ADDRESS_LOOKUP_TABLE_ID,
-            data=data,
-            accounts=[
+            ADDRESS_LOOKUP_TABLE_ID,
+            bytes(data),
+            [
                 SolAccountMeta(pubkey=table_account, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=False),  # signer
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=True),   # payer
-                SolAccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+                self._operator_ro_meta,  # signer
+                self._operator_w_meta,  # payer
+                _SYS_PROGRAM_RO_META,
             ]
         )
 
     def make_deactivate_lookup_table_ix(self, table_account: SolPubKey) -> SolTxIx:
-        data = int(3).to_bytes(4, byteorder='little')
+        data = _ALT_IX_DEACTIVATE
         return SolTxIx(
-            program_id=ADDRESS_LOOKUP_TABLE_ID,
-            data=data,
-            accounts=[
+            ADDRESS_LOOKUP_TABLE_ID,
+            data,
+            [
                 SolAccountMeta(pubkey=table_account, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=False),  # signer
+                self._operator_ro_meta,  # signer
             ]
         )
 
     def make_close_lookup_table_ix(self, table_account: SolPubKey) -> SolTxIx:
-        data = int(4).to_bytes(4, byteorder='little')
+        data = _ALT_IX_CLOSE
         return SolTxIx(
-            program_id=ADDRESS_LOOKUP_TABLE_ID,
-            data=data,
-            accounts=[
+            ADDRESS_LOOKUP_TABLE_ID,
+            data,
+            [
                 SolAccountMeta(pubkey=table_account, is_signer=False, is_writable=True),
-                SolAccountMeta(pubkey=self._operator_account, is_signer=True, is_writable=False),  # signer
+                self._operator_ro_meta,  # signer
                 SolAccountMeta(pubkey=self._operator_account, is_signer=False, is_writable=True),  # refund
             ]
         )
 
     def make_compute_budget_heap_ix(self) -> SolTxIx:
         heap_frame_size = self._elf_params.neon_heap_frame
-        return SolTxIx(
-            program_id=COMPUTE_BUDGET_ID,
-            accounts=[],
-            data=b'\x01' + heap_frame_size.to_bytes(4, 'little')
-        )
+        return SolTxIx(COMPUTE_BUDGET_ID, _COMPUTE_BUDGET_IX_HEAP + _pack_u32(heap_frame_size), [])
 
     def make_compute_budget_cu_ix(self) -> SolTxIx:
         compute_unit_cnt = self._elf_params.neon_compute_units
-        return SolTxIx(
-            program_id=COMPUTE_BUDGET_ID,
-            accounts=[],
-            data=b'\x02' + compute_unit_cnt.to_bytes(4, 'little')
-        )
+        return SolTxIx(COMPUTE_BUDGET_ID, _COMPUTE_BUDGET_IX_CU + _pack_u32(compute_unit_cnt), [])
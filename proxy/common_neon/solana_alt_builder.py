@@ -6,6 +6,7 @@ from typing import Optional, List
 
 from .errors import ALTContentError
 from .neon_instruction import NeonIxBuilder
+from .layouts import ALTAccountInfo, AccountInfo
 from .solana_alt import ALTInfo
 from .solana_alt_limit import ALTLimit
 from .solana_interactor import SolInteractor
@@ -121,10 +122,25 @@ class ALTTxBuilder:
 
         return tx_list_list
 
+    def read_alt_acct_info_list(self, alt_info_list: List[ALTInfo]) -> List[Optional[AccountInfo]]:
+        """Reads the raw accounts in one request, they are decoded in update_alt_info()"""
+        table_account_list = [alt_info.table_account for alt_info in alt_info_list]
+        if not len(table_account_list):
+            return list()
+
+        acct_info_list = self._solana.get_account_info_list(table_account_list)
+        # on a request error the list of results is shorter than the list of accounts
+        acct_info_list.extend([None] * (len(table_account_list) - len(acct_info_list)))
+        return acct_info_list
+
+    @staticmethod
+    def update_alt_info(alt_info: ALTInfo, acct_info: Optional[AccountInfo]) -> None:
+        if acct_info is None:
+            raise ALTContentError(str(alt_info.table_account), 'cannot read lookup table')
+        alt_info.update_from_account(ALTAccountInfo.from_account_info(acct_info))
+
     def update_alt_info_list(self, alt_info_list: List[ALTInfo]) -> None:
         # Accounts in Account Lookup Table can be reordered
-        for alt_info in alt_info_list:
-            alt_acct_info = self._solana.get_account_lookup_table_info(alt_info.table_account)
-            if alt_acct_info is None:
-                raise ALTContentError(str(alt_info.table_account), 'cannot read lookup table')
-            alt_info.update_from_account(alt_acct_info)
+        acct_info_list = self.read_alt_acct_info_list(alt_info_list)
+        for alt_info, acct_info in zip(alt_info_list, acct_info_list):
+            self.update_alt_info(alt_info, acct_info)
@@ -4,9 +4,10 @@ import base64
 from dataclasses import dataclass
 import itertools
 import json
+import random
 import threading
 import time
-from typing import Dict, Union, Any, List, Optional, Set, cast
+from typing import Dict, Union, Any, List, Optional, Set, Tuple, cast
 import logging
 import base58
 import requests
@@ -61,6 +62,11 @@ class SolBlockStatus:
 
 
 class SolInteractor:
+    # Exponential backoff on connection errors: 0.5, 1, 2, 2, ... seconds + jitter
+    _retry_base_sec = 0.5
+    _retry_max_sec = 2.0
+    _retry_jitter_sec = 0.25
+
     def __init__(self, config: Config, solana_url: str) -> None:
         self._config = config
         self._request_cnt = itertools.count()
@@ -76,6 +82,10 @@ class SolInteractor:
         raw_response.raise_for_status()
         return raw_response
 
+    def _get_retry_sleep_sec(self, retry: int) -> float:
+        sleep_sec = min(self._retry_base_sec * (2 ** (retry - 1)), self._retry_max_sec)
+        return sleep_sec + random.uniform(0, self._retry_jitter_sec)
+
     def _send_post_request(self, request: Union[List[Dict[str, Any]], Dict[str, Any]]) -> requests.Response:
         """This method is used to make retries to send request to Solana"""
 
@@ -94,7 +104,7 @@ class SolInteractor:
                         f'Receive connection error {str_err} on connection to Solana. '
                         f'Attempt {retry + 1} to send the request to Solana node...'
                     )
-                    time.sleep(1)
+                    time.sleep(self._get_retry_sleep_sec(retry))
                     continue
 
                 LOG.warning(f'Connection exception on send request to Solana. Retry {retry}: {str_err}')
@@ -129,22 +139,23 @@ class SolInteractor:
         full_request_list = list()
         full_response_list = list()
         request_list = list()
-        request_data = ''
+        request_data_len = 0
 
         for params in params_list:
             request = self._build_rpc_request(method, *params)
             request_list.append(request)
-            request_data += ', ' + json.dumps(request)
+            # only the size is required, so don't concatenate the serialized requests
+            request_data_len += len(json.dumps(request)) + 2
             full_request_list.append(request)
 
             # Protection from big payload
-            if len(request_data) >= 48 * 1024 or len(full_request_list) == len(params_list):
+            if request_data_len >= 48 * 1024 or len(full_request_list) == len(params_list):
                 raw_response = self._send_post_request(request_list)
                 response_data = cast(List[RPCResponse], raw_response.json())
 
                 full_response_list += response_data
                 request_list.clear()
-                request_data = ''
+                request_data_len = 0
 
         full_response_list.sort(key=lambda r: r['id'])
 
@@ -341,6 +352,25 @@ class SolInteractor:
         neon_account_info = self.get_neon_account_info(neon_account, commitment)
         return neon_account_info.tx_count if neon_account_info is not None else 0
 
+    def get_neon_and_holder_account_info(self, neon_account: Union[str, bytes, NeonAddress],
+                                         holder_account: SolPubKey,
+                                         commitment=SolCommit.Confirmed
+                                         ) -> Tuple[Optional[NeonAccountInfo], Optional[HolderAccountInfo]]:
+        """Reads the Neon account and the holder account in one getMultipleAccounts request"""
+        if not isinstance(neon_account, NeonAddress):
+            neon_account = NeonAddress(neon_account)
+        account_sol, _nonce = neon_2program(self._config.evm_program_id, neon_account)
+        info_list = self.get_account_info_list([account_sol, holder_account], commitment=commitment)
+        if len(info_list) != 2:
+            return None, None
+
+        neon_info, holder_info = info_list
+        if neon_info is not None:
+            neon_info = NeonAccountInfo.from_account_info(neon_info)
+        if holder_info is not None:
+            holder_info = HolderAccountInfo.from_account_info(holder_info)
+        return neon_info, holder_info
+
     def get_neon_account_info_list(self, neon_account_list: List[Union[NeonAddress, str]],
                                    commitment=SolCommit.Confirmed) -> List[Optional[NeonAccountInfo]]:
         requests_list = list()
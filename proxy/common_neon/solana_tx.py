@@ -78,6 +78,7 @@ class SolTxSizeError(AttributeError):
 
 class SolTx(abc.ABC):
     _empty_block_hash = SolBlockHash.default()
+    max_size = _SolPktDataSize
 
     def __init__(self, name: str, ix_list: Optional[Sequence[SolTxIx]]) -> None:
         self._name = name
@@ -29,6 +29,44 @@ class InvalidNeonTx(RuntimeError):
     pass
 
 
+def _rlp_encode_len(size: int, offset: int) -> bytes:
+    if size < 56:
+        return bytes((offset + size,))
+    size_buf = size.to_bytes((size.bit_length() + 7) // 8, byteorder='big')
+    return bytes((offset + 55 + len(size_buf),)) + size_buf
+
+
+def _rlp_encode_bytes(value: bytes) -> bytes:
+    size = len(value)
+    if (size == 1) and (value[0] < 0x80):
+        return value
+    return _rlp_encode_len(size, 0x80) + value
+
+
+def _rlp_encode_int(value: int) -> bytes:
+    if value == 0:
+        return b'\x80'
+    elif 0 < value < 0x80:
+        return bytes((value,))
+    return _rlp_encode_bytes(value.to_bytes((value.bit_length() + 7) // 8, byteorder='big'))
+
+
+def rlp_encode_neon_tx(tx: NeonTx) -> bytes:
+    """Field-specialized RLP encoder, produces the same result as rlp.encode(tx)"""
+    payload = b''.join((
+        _rlp_encode_int(tx.nonce),
+        _rlp_encode_int(tx.gasPrice),
+        _rlp_encode_int(tx.gasLimit),
+        _rlp_encode_bytes(tx.toAddress),
+        _rlp_encode_int(tx.value),
+        _rlp_encode_bytes(tx.callData),
+        _rlp_encode_int(tx.v),
+        _rlp_encode_int(tx.r),
+        _rlp_encode_int(tx.s)
+    ))
+    return _rlp_encode_len(len(payload), 0xc0) + payload
+
+
 class NeonNoChainTx(rlp.Serializable):
     fields = (
         ('nonce', rlp.codec.big_endian_int),
@@ -62,6 +100,7 @@ class NeonTx(rlp.Serializable):
 
     def __init__(self, *args, **kwargs):
         rlp.Serializable.__init__(self, *args, **kwargs)
+        self._rlp_msg: Optional[bytes] = None
         self._tx_sig: Optional[bytes] = None
         self._hex_tx_sig: Optional[str] = None
         self._sender: Optional[bytes] = None
@@ -83,7 +122,10 @@ class NeonTx(rlp.Serializable):
     @classmethod
     def from_string(cls, s) -> NeonTx:
         try:
-            return rlp.decode(s, NeonTx)
+            tx = rlp.decode(s, NeonTx)
+            # rlp.decode() accepts only the canonical encoding, so the source is equal to rlp.encode(tx)
+            tx._rlp_msg = bytes(s)
+            return tx
         except rlp.exceptions.ObjectDeserializationError as err:
             if (not err.list_exception) or (len(err.list_exception.serial) != 6):
                 raise
@@ -159,16 +201,16 @@ class NeonTx(rlp.Serializable):
             self._hex_sender = '0x' + self.sender.hex()
         return self._hex_sender
 
+    @property
+    def rlp_msg(self) -> bytes:
+        if self._rlp_msg is None:
+            self._rlp_msg = rlp_encode_neon_tx(self)
+        return self._rlp_msg
+
     @property
     def tx_sig(self) -> bytes:
         if self._tx_sig is None:
-            self._tx_sig = keccak_256(
-                rlp.encode((
-                    self.nonce, self.gasPrice, self.gasLimit,
-                    self.toAddress, self.value, self.callData,
-                    self.v, self.r, self.s
-                ))
-            ).digest()
+            self._tx_sig = keccak_256(self.rlp_msg).digest()
         return self._tx_sig
 
     @property
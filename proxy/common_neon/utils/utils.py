@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import time
+from dataclasses import is_dataclass, fields
 from enum import Enum
 from typing import Dict, Any, Tuple, List, Set, Union
 
@@ -16,6 +17,51 @@ def str_enum(value: Enum) -> str:
     return value
 
 
+def _has_attr_dict(obj: Any) -> bool:
+    return hasattr(obj, '__dict__') or (is_dataclass(obj) and (not isinstance(obj, type)))
+
+
+def _get_attr_dict(obj: Any) -> Dict[str, Any]:
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    # dataclasses with __slots__ don't have __dict__
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
+def _dataclass_getstate(self) -> List[Any]:
+    return [getattr(self, field.name) for field in fields(self)]
+
+
+def _dataclass_setstate(self, state: List[Any]) -> None:
+    # frozen dataclasses raise an error in __setattr__()
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def dataclass_slots(cls: type) -> type:
+    """Rebuilds the dataclass with __slots__, the same as dataclass(slots=True), which is available since Python 3.10"""
+    field_name_list = [field.name for field in fields(cls)]
+
+    inherited_slot_set: Set[str] = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slot_set.update(getattr(base, '__slots__', tuple()))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = tuple(name for name in field_name_list if name not in inherited_slot_set)
+    # the default values are stored in the fields, the class attributes conflict with the slots
+    for name in field_name_list:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    if cls.__dataclass_params__.frozen:
+        # the default pickle protocol sets the slots via __setattr__()
+        cls_dict['__getstate__'] = _dataclass_getstate
+        cls_dict['__setstate__'] = _dataclass_setstate
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 def str_fmt_object(obj: Any, skip_underling=True, name='') -> str:
     def _decode_name(value: Any) -> str:
         result = f'{type(value)}'
@@ -83,8 +129,8 @@ def str_fmt_object(obj: Any, skip_underling=True, name='') -> str:
             value = str(value)
             if LOG_FULL_OBJECT_INFO or (len(value) > 0):
                 return True, value
-        elif hasattr(value, '__dict__'):
-            return _lookup_dict_as_value(_decode_name(value), value.__dict__)
+        elif _has_attr_dict(value):
+            return _lookup_dict_as_value(_decode_name(value), _get_attr_dict(value))
         return False, '?'
 
     def _lookup_dict(d: Dict[str, Any]) -> str:
@@ -109,8 +155,8 @@ def str_fmt_object(obj: Any, skip_underling=True, name='') -> str:
     if len(name) == 0:
         name = _decode_name(obj)
 
-    if hasattr(obj, '__dict__'):
-        content = _lookup_dict(obj.__dict__)
+    if _has_attr_dict(obj):
+        content = _lookup_dict(_get_attr_dict(obj))
     elif isinstance(obj, dict):
         content = _lookup_dict(obj)
     else:
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Iterator, Generator, List, Optional, Dict, Set, Deque, Tuple, Any, cast
 
 from ..common_neon.config import Config
-from ..common_neon.neon_instruction import EvmIxCode, EvmIxCodeName
+from ..common_neon.neon_instruction import EvmIxCode, get_ix_code_name
 from ..common_neon.solana_neon_tx_receipt import SolTxMetaInfo, SolNeonIxReceiptInfo, SolTxCostInfo, SolTxReceiptInfo
 from ..common_neon.solana_tx import SolCommit
 from ..common_neon.utils.evm_log_decoder import NeonLogTxEvent
@@ -618,7 +618,7 @@ class NeonIndexedBlockInfo:
             return
 
         def _new_stat(new_ix_code: EvmIxCode) -> NeonTxStatData:
-            tx_type = EvmIxCodeName().get(new_ix_code)
+            tx_type = get_ix_code_name(new_ix_code)
             new_stat = NeonTxStatData(tx_type=tx_type)
             return new_stat
 
@@ -61,11 +61,15 @@ class IndexerBase:
     def run(self):
         check_sec = float(self._config.indexer_check_msec) / 1000
         while True:
+            deadline = time.monotonic() + check_sec
             try:
                 self.process_functions()
             except BaseException as exc:
                 LOG.warning('Exception on transactions processing.', exc_info=exc)
-            time.sleep(check_sec)
+
+            sleep_sec = deadline - time.monotonic()
+            if sleep_sec > 0:
+                time.sleep(sleep_sec)
 
     def process_functions(self) -> None:
         pass
@@ -160,11 +160,18 @@ class IndexerDB:
     def get_tx_list_by_block_slot(self, block_slot: int) -> List[NeonTxReceiptInfo]:
         return self._neon_txs_db.get_tx_list_by_block_slot(block_slot)
 
+    def get_tx_sig_and_gas_list_by_block_slot(self, block_slot: int) -> List[Tuple[str, int]]:
+        return self._neon_txs_db.get_tx_sig_and_gas_list_by_block_slot(block_slot)
+
+    def get_tx_cnt_by_block_slot(self, block_slot: int) -> int:
+        return self._neon_txs_db.get_tx_cnt_by_block_slot(block_slot)
+
     def get_tx_by_neon_sig(self, neon_sig: str) -> Optional[NeonTxReceiptInfo]:
         return self._neon_txs_db.get_tx_by_neon_sig(neon_sig)
 
-    def get_tx_by_block_slot_tx_idx(self, block_slot: int, tx_idx: int) -> Optional[NeonTxReceiptInfo]:
-        return self._neon_txs_db.get_tx_by_block_slot_tx_idx(block_slot, tx_idx)
+    def get_tx_by_block_slot_tx_idx(self, block_slot: int, tx_idx: int,
+                                    is_active_block=False) -> Optional[NeonTxReceiptInfo]:
+        return self._neon_txs_db.get_tx_by_block_slot_tx_idx(block_slot, tx_idx, is_active_block)
 
     def get_sol_sig_list_by_neon_sig(self, neon_sig: str) -> List[str]:
         return self._sol_neon_txs_db.get_sol_sig_list_by_neon_sig(neon_sig)
@@ -172,6 +179,10 @@ class IndexerDB:
     def get_sol_ix_info_list_by_neon_sig(self, neon_sig: str) -> List[SolNeonIxReceiptShortInfo]:
         return self._sol_neon_txs_db.get_sol_ix_info_list_by_neon_sig(neon_sig)
 
+    def get_sol_ix_info_and_cost_list_by_neon_sig(self, neon_sig: str
+                                                  ) -> Tuple[List[SolNeonIxReceiptShortInfo], List[SolTxCostInfo]]:
+        return self._sol_neon_txs_db.get_sol_ix_info_and_cost_list_by_neon_sig(neon_sig)
+
     def get_cost_list_by_sol_sig_list(self, sol_sig_list: List[str]) -> List[SolTxCostInfo]:
         return self._sol_tx_costs_db.get_cost_list_by_sol_sig_list(sol_sig_list)
 
@@ -4,7 +4,7 @@ import dataclasses
 from typing import Any, List, Type, Optional, Iterator
 
 from ..common_neon.utils import NeonTxInfo
-from ..common_neon.neon_instruction import EvmIxCode, EvmIxCodeName
+from ..common_neon.neon_instruction import EvmIxCode, get_ix_code_name
 from ..common_neon.utils.evm_log_decoder import NeonLogTxEvent
 
 from ..indexer.indexed_objects import NeonIndexedTxInfo, NeonIndexedHolderInfo, NeonAccountInfo, SolNeonTxDecoderState
@@ -31,7 +31,7 @@ class DummyIxDecoder:
 
     @classmethod
     def name(cls) -> str:
-        return EvmIxCodeName().get(cls.ix_code(), 'UNKNOWN')
+        return get_ix_code_name(cls.ix_code(), 'UNKNOWN')
 
     def __str__(self):
         if self._is_deprecated:
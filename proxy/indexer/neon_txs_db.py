@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Iterator
+from typing import Optional, List, Any, Iterator, Tuple
 
 from ..common_neon.utils import NeonTxResultInfo, NeonTxInfo, NeonTxReceiptInfo
 from ..common_neon.db.base_db_table import BaseDBTable
@@ -33,15 +33,18 @@ class NeonTxsDB(BaseDBTable):
         self._hex_tx_column_set = {'nonce', 'value', 'gas_price', 'gas_limit', 'v', 'r', 's'}
         self._hex_res_column_set = {'status', 'gas_used', 'sum_gas_used'}
 
+    @staticmethod
+    def _decode_hex_value(value: str) -> int:
+        if len(value) > 2:
+            return int(value[2:], 16)
+        return 0
+
     def _tx_from_value(self, value_list: List[Any]) -> Optional[NeonTxReceiptInfo]:
         if not len(value_list):
             return None
 
         def _decode_hex(name: str) -> int:
-            value = self._get_column_value(name, value_list)
-            if len(value) > 2:
-                return int(value[2:], 16)
-            return 0
+            return self._decode_hex_value(self._get_column_value(name, value_list))
 
         neon_tx = NeonTxInfo(
             addr=self._get_column_value('from_addr', value_list),
@@ -117,8 +120,41 @@ class NeonTxsDB(BaseDBTable):
 
         return [self._tx_from_value(value_list) for value_list in row_list if value_list is not None]
 
-    def get_tx_by_block_slot_tx_idx(self, block_slot: int, tx_idx: int) -> Optional[NeonTxReceiptInfo]:
-        request = self._base_request_hdr + '''
+    def get_tx_sig_and_gas_list_by_block_slot(self, block_slot: int) -> List[Tuple[str, int]]:
+        """Returns (neon_sig, sum_gas_used) of txs in the block without decoding of the whole receipts"""
+        request = f'''
+            SELECT a.neon_sig, a.sum_gas_used
+              FROM {self._table_name} AS a
+        INNER JOIN {self._blocks_table_name} AS b
+                ON b.block_slot = a.block_slot
+             WHERE a.block_slot = %s
+          ORDER BY a.tx_idx ASC
+        '''
+        row_list = self._db.fetch_all(request, (block_slot,))
+        if not row_list:
+            return list()
+
+        return [(neon_sig, self._decode_hex_value(sum_gas_used)) for neon_sig, sum_gas_used in row_list]
+
+    def get_tx_cnt_by_block_slot(self, block_slot: int) -> int:
+        request = f'''
+            SELECT COUNT(*)
+              FROM {self._table_name} AS a
+        INNER JOIN {self._blocks_table_name} AS b
+                ON b.block_slot = a.block_slot
+             WHERE a.block_slot = %s
+        '''
+        value_list = self._db.fetch_one(request, (block_slot,))
+        return value_list[0] if len(value_list) else 0
+
+    def get_tx_by_block_slot_tx_idx(self, block_slot: int, tx_idx: int,
+                                    is_active_block=False) -> Optional[NeonTxReceiptInfo]:
+        request = self._base_request_hdr
+        if is_active_block:
+            request += '''
+               AND b.is_active = True
+            '''
+        request += '''
              WHERE a.block_slot = %s
                AND a.tx_idx = %s
         '''
@@ -1,8 +1,8 @@
-from typing import List, Any, Iterator, Set
+from typing import List, Any, Iterator, Set, Tuple
 
 from ..common_neon.db.base_db_table import BaseDBTable
 from ..common_neon.db.db_connect import DBConnection
-from ..common_neon.solana_neon_tx_receipt import SolNeonIxReceiptInfo, SolNeonIxReceiptShortInfo
+from ..common_neon.solana_neon_tx_receipt import SolNeonIxReceiptInfo, SolNeonIxReceiptShortInfo, SolTxCostInfo
 
 
 class SolNeonTxsDB(BaseDBTable):
@@ -17,6 +17,7 @@ class SolNeonTxsDB(BaseDBTable):
             ],
             key_list=['sol_sig', 'block_slot', 'idx', 'inner_idx']
         )
+        self._sol_tx_costs_table_name = 'solana_transaction_costs'
 
     def set_tx_list(self, iter_sol_neon_ix: Iterator[SolNeonIxReceiptInfo]) -> None:
         row_list: List[List[Any]] = list()
@@ -77,29 +78,68 @@ class SolNeonTxsDB(BaseDBTable):
           ORDER BY a.neon_total_gas_used
         '''
 
+        row_list = self._db.fetch_all(request, (neon_sig,))
+        return [self._decode_sol_ix_info(value_list) for value_list in row_list]
+
+    def get_sol_ix_info_and_cost_list_by_neon_sig(self, neon_sig: str
+                                                  ) -> Tuple[List[SolNeonIxReceiptShortInfo], List[SolTxCostInfo]]:
+        """Reads Solana instructions of the Neon tx together with costs of Solana txs in one request"""
+        request = f'''
+            SELECT {', '.join(f'a.{c}' for c in self._column_list)},
+                   c.operator, c.sol_spent
+              FROM {self._table_name} a
+        INNER JOIN {self._blocks_table_name} AS b
+                ON b.block_slot = a.block_slot
+               AND b.is_active = True
+         LEFT JOIN {self._sol_tx_costs_table_name} AS c
+                ON c.sol_sig = a.sol_sig
+               AND c.block_slot = a.block_slot
+             WHERE a.neon_sig = %s
+          ORDER BY a.neon_total_gas_used
+        '''
+
         row_list = self._db.fetch_all(request, (neon_sig,))
 
         sol_ix_list: List[SolNeonIxReceiptShortInfo] = list()
+        sol_cost_list: List[SolTxCostInfo] = list()
+        done_sig_set: Set[str] = set()
+        column_cnt = len(self._column_list)
 
         for value_list in row_list:
-            ix_info = SolNeonIxReceiptShortInfo(
-                sol_sig=self._get_column_value('sol_sig', value_list),
-                block_slot=self._get_column_value('block_slot', value_list),
-                idx=self._get_column_value('idx', value_list),
-                inner_idx=self._get_column_value('inner_idx', value_list),
-                ix_code=self._get_column_value('ix_code', value_list),
-                is_success=self._get_column_value('is_success', value_list),
-                neon_step_cnt=self._get_column_value('neon_step_cnt', value_list),
-                neon_gas_used=self._get_column_value('neon_gas_used', value_list),
-                neon_total_gas_used=self._get_column_value('neon_total_gas_used', value_list),
-                max_heap_size=self._get_column_value('max_heap_size', value_list),
-                used_heap_size=self._get_column_value('used_heap_size', value_list),
-                max_bpf_cycle_cnt=self._get_column_value('max_bpf_cycle_cnt', value_list),
-                used_bpf_cycle_cnt=self._get_column_value('used_bpf_cycle_cnt', value_list),
-            )
+            ix_info = self._decode_sol_ix_info(value_list)
             sol_ix_list.append(ix_info)
 
-        return sol_ix_list
+            operator, sol_spent = value_list[column_cnt:]
+            if (operator is None) or (ix_info.sol_sig in done_sig_set):
+                continue
+
+            done_sig_set.add(ix_info.sol_sig)
+            cost_info = SolTxCostInfo(
+                sol_sig=ix_info.sol_sig,
+                block_slot=ix_info.block_slot,
+                operator=operator,
+                sol_spent=sol_spent
+            )
+            sol_cost_list.append(cost_info)
+
+        return sol_ix_list, sol_cost_list
+
+    def _decode_sol_ix_info(self, value_list: List[Any]) -> SolNeonIxReceiptShortInfo:
+        return SolNeonIxReceiptShortInfo(
+            sol_sig=self._get_column_value('sol_sig', value_list),
+            block_slot=self._get_column_value('block_slot', value_list),
+            idx=self._get_column_value('idx', value_list),
+            inner_idx=self._get_column_value('inner_idx', value_list),
+            ix_code=self._get_column_value('ix_code', value_list),
+            is_success=self._get_column_value('is_success', value_list),
+            neon_step_cnt=self._get_column_value('neon_step_cnt', value_list),
+            neon_gas_used=self._get_column_value('neon_gas_used', value_list),
+            neon_total_gas_used=self._get_column_value('neon_total_gas_used', value_list),
+            max_heap_size=self._get_column_value('max_heap_size', value_list),
+            used_heap_size=self._get_column_value('used_heap_size', value_list),
+            max_bpf_cycle_cnt=self._get_column_value('max_bpf_cycle_cnt', value_list),
+            used_bpf_cycle_cnt=self._get_column_value('used_bpf_cycle_cnt', value_list),
+        )
 
     def finalize_block_list(self, base_block_slot: int, block_slot_list: List[int]) -> None:
         request = f'''
@@ -3,18 +3,19 @@ from __future__ import annotations
 import asyncio
 import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any, Optional, List, Dict
 
 from ..common_neon.data import NeonTxExecCfg
 from ..common_neon.operator_resource_info import OpResIdent
 from ..common_neon.solana_tx import SolPubKey
-from ..common_neon.utils import str_fmt_object
+from ..common_neon.utils import str_fmt_object, dataclass_slots
 from ..common_neon.utils.eth_proto import NeonTx
 from ..common_neon.utils.neon_tx_info import NeonTxInfo
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPTask:
     executor_id: int
@@ -39,6 +40,7 @@ class MPRequestType(IntEnum):
     Unspecified = 255
 
 
+@dataclass_slots
 @dataclass
 class MPRequest:
     req_id: str
@@ -48,30 +50,31 @@ class MPRequest:
         return str_fmt_object(self)
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPStuckTxInfo:
     neon_tx: NeonTxInfo
     holder_account: SolPubKey
     alt_addr_list: List[str]
     start_time: int
+    sig: str = field(init=False)
+    req_id: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'sig', self.neon_tx.sig)
+        object.__setattr__(self, 'req_id', self.neon_tx.sig[2:10])
 
     def __str__(self) -> str:
         return str_fmt_object(self)
 
-    @property
-    def sig(self) -> str:
-        return self.neon_tx.sig
-
-    @property
-    def req_id(self) -> str:
-        return self.neon_tx.sig[2:10]
-
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPGetStuckTxListResponse:
     stuck_tx_list: List[MPStuckTxInfo]
 
 
+@dataclass_slots
 @dataclass
 class MPTxRequest(MPRequest):
     neon_tx: Optional[NeonTx] = None
@@ -79,6 +82,9 @@ class MPTxRequest(MPRequest):
     neon_tx_exec_cfg: Optional[NeonTxExecCfg] = None
     gas_price: int = 0
     start_time: int = 0
+    sig: str = field(init=False)
+    sender_address: str = field(init=False)
+    nonce: int = field(init=False)
 
     @staticmethod
     def from_neon_tx(req_id: str, neon_tx: NeonTx, neon_tx_exec_cfg: NeonTxExecCfg) -> MPTxRequest:
@@ -93,23 +99,15 @@ class MPTxRequest(MPRequest):
 
     def __post_init__(self):
         self.type = MPRequestType.SendTransaction
-
-    @property
-    def sig(self) -> str:
-        return self.neon_tx_info.sig
-
-    @property
-    def sender_address(self) -> str:
-        return self.neon_tx_info.addr
-
-    @property
-    def nonce(self) -> int:
-        return self.neon_tx_info.nonce
+        self.sig = self.neon_tx_info.sig
+        self.sender_address = self.neon_tx_info.addr
+        self.nonce = self.neon_tx_info.nonce
 
     def has_chain_id(self) -> bool:
         return self.neon_tx_info.has_chain_id()
 
 
+@dataclass_slots
 @dataclass
 class MPTxExecRequest(MPTxRequest):
     elf_param_dict: Dict[str, str] = None
@@ -153,6 +151,7 @@ class MPTxExecRequest(MPTxRequest):
 MPTxRequestList = List[MPTxRequest]
 
 
+@dataclass_slots
 @dataclass
 class MPPendingTxNonceRequest(MPRequest):
     sender: str = None
@@ -161,6 +160,7 @@ class MPPendingTxNonceRequest(MPRequest):
         self.type = MPRequestType.GetPendingTxNonce
 
 
+@dataclass_slots
 @dataclass
 class MPMempoolTxNonceRequest(MPRequest):
     sender: str = None
@@ -169,6 +169,7 @@ class MPMempoolTxNonceRequest(MPRequest):
         self.type = MPRequestType.GetMempoolTxNonce
 
 
+@dataclass_slots
 @dataclass
 class MPPendingTxByHashRequest(MPRequest):
     tx_hash: str = None
@@ -177,6 +178,7 @@ class MPPendingTxByHashRequest(MPRequest):
         self.type = MPRequestType.GetTxByHash
 
 
+@dataclass_slots
 @dataclass
 class MPGasPriceRequest(MPRequest):
     last_update_mapping_sec: int = 0
@@ -187,6 +189,7 @@ class MPGasPriceRequest(MPRequest):
         self.type = MPRequestType.GetGasPrice
 
 
+@dataclass_slots
 @dataclass
 class MPElfParamDictRequest(MPRequest):
     elf_param_dict: Dict[str, str] = None
@@ -195,6 +198,7 @@ class MPElfParamDictRequest(MPRequest):
         self.type = MPRequestType.GetElfParamDict
 
 
+@dataclass_slots
 @dataclass
 class MPSenderTxCntRequest(MPRequest):
     sender_list: List[str] = None
@@ -203,12 +207,14 @@ class MPSenderTxCntRequest(MPRequest):
         self.type = MPRequestType.GetStateTxCnt
 
 
+@dataclass_slots
 @dataclass
 class MPOpResGetListRequest(MPRequest):
     def __post_init__(self):
         self.type = MPRequestType.GetOperatorResourceList
 
 
+@dataclass_slots
 @dataclass
 class MPOpResInitRequest(MPRequest):
     elf_param_dict: Dict[str, str] = None
@@ -218,12 +224,14 @@ class MPOpResInitRequest(MPRequest):
         self.type = MPRequestType.InitOperatorResource
 
 
+@dataclass_slots
 @dataclass
 class MPALTAddress:
     table_account: str
     secret: bytes
 
 
+@dataclass_slots
 @dataclass
 class MPGetALTList(MPRequest):
     secret_list: List[bytes] = None
@@ -233,6 +241,7 @@ class MPGetALTList(MPRequest):
         self.type = MPRequestType.GetALTList
 
 
+@dataclass_slots
 @dataclass
 class MPALTInfo:
     last_extended_slot: int
@@ -245,6 +254,7 @@ class MPALTInfo:
         return self.deactivation_slot is not None
 
 
+@dataclass_slots
 @dataclass
 class MPDeactivateALTListRequest(MPRequest):
     alt_info_list: List[MPALTInfo] = None
@@ -253,6 +263,7 @@ class MPDeactivateALTListRequest(MPRequest):
         self.type = MPRequestType.DeactivateALTList
 
 
+@dataclass_slots
 @dataclass
 class MPCloseALTListRequest(MPRequest):
     alt_info_list: List[MPALTInfo] = None
@@ -261,6 +272,7 @@ class MPCloseALTListRequest(MPRequest):
         self.type = MPRequestType.CloseALTList
 
 
+@dataclass_slots
 @dataclass
 class MPGetStuckTxListRequest(MPRequest):
     def __post_init__(self):
@@ -276,6 +288,7 @@ class MPTxExecResultCode(IntEnum):
     StuckTx = 5
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPTxExecResult:
     code: MPTxExecResultCode
@@ -293,12 +306,14 @@ class MPTxSendResultCode(IntEnum):
     Unspecified = 255
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPTxSendResult:
     code: MPTxSendResultCode
     state_tx_cnt: Optional[int]
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPGasPriceResult:
     suggested_gas_price: int
@@ -308,12 +323,14 @@ class MPGasPriceResult:
     neon_price_account: SolPubKey
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPSenderTxCntData:
     sender: str
     state_tx_cnt: int
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPSenderTxCntResult:
     sender_tx_cnt_list: List[MPSenderTxCntData]
@@ -326,23 +343,27 @@ class MPOpResInitResultCode(IntEnum):
     StuckTx = 3
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPOpResGetListResult:
     res_ident_list: List[OpResIdent]
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPOpResInitResult:
     code: MPOpResInitResultCode
     exc: Optional[BaseException]
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPALTListResult:
     block_height: int
     alt_info_list: List[MPALTInfo]
 
 
+@dataclass_slots
 @dataclass(frozen=True)
 class MPResult:
     error: Optional[str] = None
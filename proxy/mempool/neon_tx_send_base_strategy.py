@@ -47,6 +47,11 @@ class BaseNeonTxStrategy(abc.ABC):
         self._evm_step_cnt = ElfParams().neon_evm_steps
         self.__sol_tx_list_sender: Optional[SolTxListSender] = None
 
+    @classmethod
+    def is_applicable(cls, has_chain_id: bool, is_stuck_tx: bool) -> bool:
+        """Fast check of the Neon tx properties, which don't change during the tx execution"""
+        return True
+
     @property
     def ctx(self) -> NeonTxSendCtx:
         return self._ctx
@@ -10,6 +10,10 @@ from ..mempool.neon_tx_send_strategy_base_stages import WriteHolderNeonTxPrepSta
 class HolderNeonTxStrategy(IterativeNeonTxStrategy):
     name = 'TxStepFromAccount'
 
+    @classmethod
+    def is_applicable(cls, has_chain_id: bool, is_stuck_tx: bool) -> bool:
+        return has_chain_id
+
     def __init__(self, ctx: NeonTxSendCtx) -> None:
         super().__init__(ctx)
         self._write_holder_stage = WriteHolderNeonTxPrepStage(ctx)
@@ -19,6 +19,10 @@ class IterativeNeonTxStrategy(BaseNeonTxStrategy):
     name = 'TxStepFromData'
     _cancel_name = 'CancelWithHash'
 
+    @classmethod
+    def is_applicable(cls, has_chain_id: bool, is_stuck_tx: bool) -> bool:
+        return has_chain_id and (not is_stuck_tx)
+
     def complete_init(self) -> None:
         super().complete_init()
         self._ctx.mark_resource_use()
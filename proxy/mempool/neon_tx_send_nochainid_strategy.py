@@ -7,6 +7,10 @@ from ..mempool.neon_tx_send_strategy_base_stages import alt_strategy
 class NoChainIdNeonTxStrategy(HolderNeonTxStrategy):
     name = 'TxStepFromAccountNoChainId'
 
+    @classmethod
+    def is_applicable(cls, has_chain_id: bool, is_stuck_tx: bool) -> bool:
+        return not has_chain_id
+
     def _validate(self) -> bool:
         if self._ctx.neon_tx_info.has_chain_id():
             self._validation_error_msg = 'Normal transaction'
@@ -17,6 +17,10 @@ LOG = logging.getLogger(__name__)
 class SimpleNeonTxStrategy(BaseNeonTxStrategy):
     name = 'TxExecFromData'
 
+    @classmethod
+    def is_applicable(cls, has_chain_id: bool, is_stuck_tx: bool) -> bool:
+        return has_chain_id and (not is_stuck_tx)
+
     def execute(self) -> NeonTxResultInfo:
         assert self.is_valid()
 
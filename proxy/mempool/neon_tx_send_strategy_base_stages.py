@@ -6,6 +6,7 @@ from typing import List, Optional, Dict, Union
 from ..common_neon.constants import EMPTY_HOLDER_TAG, ACTIVE_HOLDER_TAG, FINALIZED_HOLDER_TAG, HOLDER_TAG
 from ..common_neon.elf_params import ElfParams
 from ..common_neon.errors import BadResourceError, HolderContentError, ALTContentError, StuckTxError
+from ..common_neon.errors import SolanaUnavailableError
 from ..common_neon.solana_alt import ALTInfo
 from ..common_neon.solana_alt_limit import ALTLimit
 from ..common_neon.solana_alt_builder import ALTTxBuilder, ALTTxSet
@@ -99,7 +100,11 @@ class WriteHolderNeonTxPrepStage(BaseNeonTxPrepStage):
     def _get_holder_account_info(self) -> HolderAccountInfo:
         holder_account = self._ctx.holder_account
 
-        holder_info = self._ctx.solana.get_holder_account_info(holder_account)
+        # the holder account can be already read together with the state_tx_cnt
+        holder_info = self._ctx.pop_holder_account_info()
+        if holder_info is None:
+            holder_info = self._ctx.solana.get_holder_account_info(holder_account)
+
         if holder_info is None:
             raise BadResourceError(f'Bad holder account {str(holder_account)}')
         elif holder_info.tag not in {FINALIZED_HOLDER_TAG, ACTIVE_HOLDER_TAG, HOLDER_TAG}:
@@ -142,6 +147,10 @@ class WriteHolderNeonTxPrepStage(BaseNeonTxPrepStage):
             self._validate_holder_account()
 
     def update_after_emulate(self) -> None:
+        # Stuck tx isn't emulated, its holder account is already read on the strategy validation,
+        #   and the preparation stages don't change it
+        if self._ctx.is_stuck_tx() and (self._holder_tag != EMPTY_HOLDER_TAG):
+            return
         self.update_holder_tag()
 
 
@@ -185,11 +194,20 @@ class ALTNeonTxPrepStage(BaseNeonTxPrepStage):
         return True
 
     def _filter_alt_info_list(self, actual_alt_info: ALTInfo) -> List[ALTInfo]:
+        src_alt_info_list = [ALTInfo(alt_address) for alt_address in self._ctx.alt_address_list]
         alt_info_list: List[ALTInfo] = list()
-        for alt_address in self._ctx.alt_address_list:
-            alt_info = ALTInfo(alt_address)
+
+        try:
+            acct_info_list = self._alt_builder.read_alt_acct_info_list(src_alt_info_list)
+        except (Exception, SolanaUnavailableError) as e:
+            LOG.warning(f'Skip ALTs {[str(a.table_account) for a in src_alt_info_list]}: {str(e)}')
+            return alt_info_list
+
+        for alt_info, acct_info in zip(src_alt_info_list, acct_info_list):
+            alt_address = alt_info.alt_address
             try:
-                self._alt_builder.update_alt_info_list([alt_info])
+                # each ALT is decoded separately, a bad one doesn't affect the others
+                self._alt_builder.update_alt_info(alt_info, acct_info)
                 alt_info_list.append(alt_info)
 
                 if actual_alt_info.remove_account_key_list(alt_info.account_key_list):
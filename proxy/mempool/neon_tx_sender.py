@@ -1,8 +1,12 @@
 import logging
+import time
+
+from typing import Optional, Dict, Tuple, Type
 
 from ..common_neon.emulator_interactor import call_tx_emulated
 from ..common_neon.errors import NonceTooLowError, NonceTooHighError, WrongStrategyError, RescheduleError, BigTxError
 from ..common_neon.errors import NoMoreRetriesError
+from ..common_neon.solana_tx import SolTx
 from ..common_neon.utils import NeonTxResultInfo
 
 from .neon_tx_send_base_strategy import BaseNeonTxStrategy
@@ -18,28 +22,67 @@ LOG = logging.getLogger(__name__)
 
 
 class NeonTxSendStrategyExecutor:
-    _strategy_list = [
+    __slots__ = ('_ctx', '_state_tx_cnt_time', '_viable_idx_list')
+
+    _strategy_list: Tuple[Type[BaseNeonTxStrategy], ...] = (
         SimpleNeonTxStrategy, ALTSimpleNeonTxStrategy,
         IterativeNeonTxStrategy, ALTIterativeNeonTxStrategy,
         SimpleHolderNeonTxStrategy, ALTSimpleHolderNeonTxStrategy,
         HolderNeonTxStrategy, ALTHolderNeonTxStrategy,
         NoChainIdNeonTxStrategy, ALTNoChainIdNeonTxStrategy
-    ]
+    )
+
+    # Solana slot time, the cached state_tx_cnt is reused inside this period
+    _state_tx_cnt_ttl_sec = 0.4
+
+    # indexes of strategies, which are applicable for the tx properties (has_chain_id, is_stuck_tx)
+    _viable_idx_dict: Dict[Tuple[bool, bool], Tuple[int, ...]] = dict()
 
     def __init__(self, ctx: NeonTxSendCtx):
         self._ctx = ctx
+        self._state_tx_cnt_time: Optional[float] = None
+        self._viable_idx_list = self._get_viable_idx_list(ctx.neon_tx_info.has_chain_id(), ctx.is_stuck_tx())
+
+    @classmethod
+    def _get_viable_idx_list(cls, has_chain_id: bool, is_stuck_tx: bool) -> Tuple[int, ...]:
+        key = (has_chain_id, is_stuck_tx)
+        viable_idx_list = cls._viable_idx_dict.get(key, None)
+        if viable_idx_list is None:
+            viable_idx_list = tuple(
+                idx for idx, strategy in enumerate(cls._strategy_list)
+                if strategy.is_applicable(has_chain_id, is_stuck_tx)
+            )
+            cls._viable_idx_dict[key] = viable_idx_list
+        return viable_idx_list
+
+    def _get_start_strategy_idx(self) -> int:
+        start = self._ctx.strategy_idx
+        if (start > 0) or self._ctx.is_stuck_tx():
+            return start
+
+        # Neon tx, which is bigger than Solana tx, can be executed only from the holder account
+        if len(self._ctx.ix_builder.holder_msg) >= SolTx.max_size:
+            LOG.debug('Skip strategies with Neon tx in the instruction data')
+            return self._strategy_list.index(SimpleHolderNeonTxStrategy)
+        return start
 
     def execute(self) -> NeonTxResultInfo:
         if not self._ctx.has_completed_receipt():
             self._validate_nonce()
 
-        start = self._ctx.strategy_idx
-        end = len(self._strategy_list)
-        for strategy_idx in range(start, end):
-            strategy = self._strategy_list[strategy_idx](self._ctx)
+        ctx = self._ctx
+        strategy_list = self._strategy_list
+        start = self._get_start_strategy_idx()
+        is_stopped = False
+        for strategy_idx in self._viable_idx_list:
+            if strategy_idx < start:
+                continue
+
+            strategy = strategy_list[strategy_idx](ctx)
             try:
                 if not strategy.validate():
-                    LOG.debug(f'Skip strategy {strategy.name}: {strategy.validation_error_msg}')
+                    if LOG.isEnabledFor(logging.DEBUG):
+                        LOG.debug(f'Skip strategy {strategy.name}: {strategy.validation_error_msg}')
                     continue
 
                 return self._execute(strategy_idx, strategy)
@@ -48,35 +91,47 @@ class NeonTxSendStrategyExecutor:
                 raise
 
             except WrongStrategyError:
-                if not self._ctx.has_completed_receipt():
+                if not ctx.has_completed_receipt():
                     continue
                 self._cancel(strategy)
                 raise
 
+            except (KeyboardInterrupt, SystemExit):
+                # the process is stopping -> no requests to Solana
+                is_stopped = True
+                raise
+
             except BaseException:
                 self._cancel(strategy)
                 raise
 
             finally:
-                self._init_state_tx_cnt()
+                if not is_stopped:
+                    if strategy.is_valid():
+                        # the strategy could change the Solana state
+                        self._reset_state_tx_cnt()
+                    self._init_state_tx_cnt()
 
         raise BigTxError()
 
     def _execute(self, strategy_idx: int, strategy: BaseNeonTxStrategy) -> NeonTxResultInfo:
-        LOG.debug(f'Use strategy {strategy.name}')
+        LOG.debug('Use strategy %s', strategy.name)
 
         strategy.complete_init()
         self._ctx.set_strategy_idx(strategy_idx)
 
         # Try `retry_on_fail` times to prepare Neon tx for execution
         retry_on_fail = self._ctx.config.retry_on_fail
+        # the receipt state is changed only by the strategy execution, which ends the loop
+        has_completed_receipt = self._ctx.has_completed_receipt()
         for retry in range(retry_on_fail):
             has_changes = strategy.prep_before_emulate()
             if has_changes or (retry == 0):
                 # no re-emulation for Neon tx with started state
-                if not self._ctx.has_completed_receipt():
+                if not has_completed_receipt:
                     self._emulate_neon_tx()
                 strategy.update_after_emulate()
+                self._ctx.set_holder_account_info(None)
 
             # Preparation made changes in the Solana state -> repeat preparation and re-emulation
             if has_changes:
@@ -98,15 +153,33 @@ class NeonTxSendStrategyExecutor:
         try:
             strategy.cancel()
 
-        except RescheduleError:
+        except (RescheduleError, KeyboardInterrupt, SystemExit):
             raise
 
         except BaseException as exc:
             LOG.error(f'Failed to cancel tx', exc_info=exc)
 
-    def _init_state_tx_cnt(self) -> None:
-        state_tx_cnt = self._ctx.solana.get_state_tx_cnt(self._ctx.neon_tx_info.addr)
+    def _init_state_tx_cnt(self, with_holder_info: bool = False) -> None:
+        now = time.monotonic()
+        if with_holder_info:
+            # the holder account is read after the emulation, so refresh the state_tx_cnt by the same request
+            neon_info, holder_info = self._ctx.solana.get_neon_and_holder_account_info(
+                self._ctx.neon_tx_info.addr, self._ctx.holder_account
+            )
+            state_tx_cnt = neon_info.tx_count if neon_info is not None else 0
+            self._ctx.set_holder_account_info(holder_info)
+
+        elif (self._state_tx_cnt_time is not None) and (now - self._state_tx_cnt_time < self._state_tx_cnt_ttl_sec):
+            return
+
+        else:
+            state_tx_cnt = self._ctx.solana.get_state_tx_cnt(self._ctx.neon_tx_info.addr)
+
         self._ctx.set_state_tx_cnt(state_tx_cnt)
+        self._state_tx_cnt_time = now
+
+    def _reset_state_tx_cnt(self) -> None:
+        self._state_tx_cnt_time = None
 
     def _emulate_neon_tx(self) -> None:
         if self._ctx.is_stuck_tx():
@@ -114,13 +187,16 @@ class NeonTxSendStrategyExecutor:
 
         emulated_result = call_tx_emulated(self._ctx.config, self._ctx.neon_tx)
         self._ctx.set_emulated_result(emulated_result)
-        self._validate_nonce()
-
-    def _validate_nonce(self) -> None:
-        self._init_state_tx_cnt()
-        if self._ctx.state_tx_cnt == self._ctx.neon_tx_info.nonce:
+        self._validate_nonce(with_holder_info=self._ctx.is_resource_used())
+
+    def _validate_nonce(self, with_holder_info: bool = False) -> None:
+        self._init_state_tx_cnt(with_holder_info)
+        state_tx_cnt = self._ctx.state_tx_cnt
+        neon_tx_info = self._ctx.neon_tx_info
+        nonce_diff = state_tx_cnt - neon_tx_info.nonce
+        if nonce_diff == 0:
             return
 
-        if self._ctx.state_tx_cnt < self._ctx.neon_tx_info.nonce:
+        if nonce_diff < 0:
             raise NonceTooHighError()
-        raise NonceTooLowError(self._ctx.neon_tx_info.addr, self._ctx.neon_tx_info.nonce, self._ctx.state_tx_cnt)
+        raise NonceTooLowError(neon_tx_info.addr, neon_tx_info.nonce, state_tx_cnt)
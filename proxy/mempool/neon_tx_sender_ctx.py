@@ -1,9 +1,10 @@
 import logging
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..common_neon.config import Config
 from ..common_neon.data import NeonAccountDict, NeonEmulatedResult
+from ..common_neon.layouts import HolderAccountInfo
 from ..common_neon.neon_instruction import NeonIxBuilder
 from ..common_neon.operator_resource_info import OpResInfo
 from ..common_neon.solana_alt import ALTAddress
@@ -19,6 +20,11 @@ LOG = logging.getLogger(__name__)
 
 
 class NeonTxSendCtx:
+    __slots__ = (
+        '_config', '_mp_tx_req', '_neon_tx_exec_cfg', '_solana', '_resource', '_ix_builder',
+        '_holder_account_info', '_neon_meta_dict'
+    )
+
     def __init__(self, config: Config, solana: SolInteractor, resource: OpResInfo, mp_tx_req: MPTxExecRequest):
         self._config = config
         self._mp_tx_req = mp_tx_req
@@ -34,6 +40,8 @@ class NeonTxSendCtx:
         else:
             self._ix_builder.init_neon_tx_sig(mp_tx_req.sig)
 
+        self._holder_account_info: Optional[HolderAccountInfo] = None
+
         self._neon_meta_dict: Dict[str, SolAccountMeta] = dict()
         if not mp_tx_req.is_stuck_tx():
             self._build_account_list(self._neon_tx_exec_cfg.account_dict)
@@ -56,14 +64,15 @@ class NeonTxSendCtx:
             self._add_meta(SolPubKey.from_string(account_desc['pubkey']), account_desc['is_writable'])
 
         neon_meta_list = list(self._neon_meta_dict.values())
-        LOG.debug(
-            f'metas ({len(neon_meta_list)}): ' +
-            ', '.join([f'{str(m.pubkey), m.is_signer, m.is_writable}' for m in neon_meta_list])
-        )
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                f'metas ({len(neon_meta_list)}): ' +
+                ', '.join([f'{str(m.pubkey), m.is_signer, m.is_writable}' for m in neon_meta_list])
+            )
 
-        contract = self._mp_tx_req.neon_tx_info.contract
-        if contract is not None:
-            LOG.debug(f'contract {contract}: {len(neon_meta_list) + 6} accounts')
+            contract = self._mp_tx_req.neon_tx_info.contract
+            if contract is not None:
+                LOG.debug(f'contract {contract}: {len(neon_meta_list) + 6} accounts')
 
         self._ix_builder.init_neon_account_list(neon_meta_list)
 
@@ -155,6 +164,16 @@ class NeonTxSendCtx:
         if self._neon_tx_exec_cfg.holder_account is None:
             self._neon_tx_exec_cfg.set_holder_account(True, self._resource.holder_account)
 
+    def is_resource_used(self) -> bool:
+        return self._neon_tx_exec_cfg.holder_account is not None
+
+    def set_holder_account_info(self, holder_info: Optional[HolderAccountInfo]) -> None:
+        self._holder_account_info = holder_info
+
+    def pop_holder_account_info(self) -> Optional[HolderAccountInfo]:
+        holder_info, self._holder_account_info = self._holder_account_info, None
+        return holder_info
+
     def has_sol_tx(self, name: str) -> bool:
         return self._neon_tx_exec_cfg.has_sol_tx(name)
 
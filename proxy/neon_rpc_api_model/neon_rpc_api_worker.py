@@ -1,11 +1,12 @@
+import functools
 import logging
-import math
 import multiprocessing
 import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor, Future
 from dataclasses import dataclass
-from typing import Optional, Union, Dict, Any, List, cast
+from typing import Optional, Union, Dict, Any, List, Tuple, cast
 
 import eth_utils
 from eth_account import Account as NeonAccount
@@ -19,12 +20,12 @@ from ..common_neon.environment_utils import NeonCli
 from ..common_neon.errors import EthereumError, InvalidParamError, RescheduleError, NonceTooLowError
 from ..common_neon.keys_storage import KeyStorage
 from ..common_neon.solana_interactor import SolInteractor
-from ..common_neon.solana_neon_tx_receipt import SolNeonIxReceiptShortInfo, SolTxCostInfo
+from ..common_neon.solana_neon_tx_receipt import SolTxCostInfo
 from ..common_neon.solana_tx import SolCommit
 from ..common_neon.utils import SolBlockInfo, NeonTxReceiptInfo, NeonTxInfo, NeonTxResultInfo
 from ..common_neon.layouts import NeonAccountInfo
 from ..common_neon.utils.eth_proto import NeonTx
-from ..common_neon.neon_instruction import EvmIxCodeName
+from ..common_neon.neon_instruction import get_ix_code_name
 
 
 from ..mempool import MemPoolClient, MP_SERVICE_ADDR, MPTxSendResult, MPTxSendResultCode, MPGasPriceResult
@@ -42,20 +43,87 @@ NEON_PROXY_REVISION = 'NEON_PROXY_REVISION_TO_BE_REPLACED'
 LOG = logging.getLogger(__name__)
 
 
+_EMPTY_LOGS_BLOOM = '0x' + '0' * 512
+_EMPTY_ROOT = '0x' + '0' * 63 + '1'
+_EMPTY_UNCLES_HASH = '0x1dcc4de8dec75d7aab85b567b6ccd41ad312451b948a7413f0a142fd40d49347'
+_ZERO_ADDRESS = '0x' + '0' * 40
+_ZERO_BLOCK_NONCE = '0x0000000000000000'
+
+_EVENT_TYPE_NAME_DICT: Dict[int, str] = {
+    1: 'LOG',
+    101: 'ENTER CALL',
+    102: 'ENTER CALL CODE',
+    103: 'ENTER STATICCALL',
+    104: 'ENTER DELEGATECALL',
+    105: 'ENTER CREATE',
+    106: 'ENTER CREATE2',
+    201: 'EXIT STOP',
+    202: 'EXIT RETURN',
+    203: 'EXIT SELFDESTRUCT',
+    204: 'EXIT REVERT',
+    300: 'RETURN',
+    301: 'CANCEL'
+}
+
+_ALLOWED_METHOD_PREFIX_TUPLE = ('eth_', 'net_', 'web3_', 'neon_')
+
+_ALWAYS_ALLOWED_METHOD_SET = frozenset((
+    'eth_chainId',
+    'neon_cliVersion',
+    'neon_evmVersion',
+    'neon_solanaVersion',
+    'neon_versions',
+    'neon_getEvmParams',
+    'net_version',
+    'web3_clientVersion'
+))
+
+_PRIVATE_METHOD_SET = frozenset((
+    'eth_accounts',
+    'eth_sign',
+    'eth_sendTransaction',
+    'eth_signTransaction'
+))
+
+# keys, which are removed from the logs included into the Solana instructions of the Neon tx receipt
+_FULL_LOG_NEON_KEY_SET = frozenset(('neonSolHash', 'neonIxIdx', 'neonInnerIxIdx'))
+_FULL_LOG_EVENT_KEY_SET = _FULL_LOG_NEON_KEY_SET | frozenset((
+    'removed', 'transactionHash', 'transactionIndex', 'blockHash', 'blockNumber'
+))
+
+
 @dataclass
 class OpCostInfo:
     sol_spent: int = 0
     neon_income: int = 0
 
 
-def get_req_id_from_log():
-    th = threading.current_thread()
-    req_id = getattr(th, "log_context", {}).get("req_id", "")
-    return req_id
+@functools.lru_cache(maxsize=4096)
+def _to_checksum_address(address: str) -> str:
+    # keccak over the address is relatively expensive, and the set of requested addresses is small
+    return eth_utils.to_checksum_address(address)
+
+
+def get_req_id_from_log() -> str:
+    log_context = getattr(threading.current_thread(), 'log_context', None)
+    if log_context is None:
+        return ''
+    return log_context.get('req_id', '')
 
 
 class NeonRpcApiWorker:
     proxy_id_glob = multiprocessing.Value('i', 0)
+    _gas_price_ttl_ns = 1_000_000_000
+    _elf_params_ttl_sec = 1.0
+
+    # Solana slot time, neon-cli reads the storage with the `recent` commitment
+    _storage_cache_ttl_sec = 0.4
+    _storage_cache_max_size = 1024
+
+    # the latest/finalized blocks change with the Solana slot cadence
+    _block_tag_cache_ttl_sec = 0.2
+
+    _solana_executor_max_workers = 8
 
     def __init__(self, config: Config):
         self._config = config
@@ -64,10 +132,35 @@ class NeonRpcApiWorker:
         self._gas_tank = GasLessAccountsDB(self._db.db_connection)
         self._mempool_client = MemPoolClient(MP_SERVICE_ADDR)
 
-        self._gas_price_value: Optional[MPGasPriceResult] = None
-        self._last_gas_price_time = 0
+        # (expiration time from time.monotonic_ns(), gas price), is replaced by one assignment
+        self._gas_price_cache: Tuple[int, Optional[MPGasPriceResult]] = (0, None)
+        self._gas_price_lock = threading.Lock()
+
+        self._last_elf_params_time = 0.0
+        self._elf_params_lock = threading.Lock()
+
+        # cached values, which depend on the ELF params
+        self._chain_id_hex: Optional[str] = None
+        self._net_version: Optional[str] = None
+        self._evm_version: Optional[str] = None
+        self._is_evm_compatible: Optional[bool] = None
+        self._evm_param_dict: Optional[Dict[str, str]] = None
+
+        # (account, position) -> (expiration time from time.monotonic(), storage value),
+        #   the dict keeps the insertion order, so the first item is the oldest one
+        self._storage_cache: Dict[Tuple[str, str], Tuple[float, str]] = dict()
+        self._storage_cache_lock = threading.Lock()
+
+        # 'latest' | 'finalized' | 'earliest' -> (expiration time from time.monotonic(), block)
+        self._block_tag_cache: Dict[str, Tuple[float, SolBlockInfo]] = dict()
+        # 'latest' | 'finalized' -> (expiration time from time.monotonic(), block slot)
+        self._block_slot_cache: Dict[str, Tuple[float, int]] = dict()
+        self._block_tag_lock = threading.Lock()
 
-        self._last_elf_params_time = 0
+        self._solana_executor = ThreadPoolExecutor(
+            max_workers=self._solana_executor_max_workers,
+            thread_name_prefix='solana'
+        )
 
         with self.proxy_id_glob.get_lock():
             self.proxy_id = self.proxy_id_glob.value
@@ -79,14 +172,21 @@ class NeonRpcApiWorker:
 
     @property
     def _gas_price(self) -> MPGasPriceResult:
-        now = math.ceil(time.time())
-        if self._last_gas_price_time != now:
-            gas_price = self._mempool_client.get_gas_price(get_req_id_from_log())
-            if gas_price is not None:
-                self._gas_price_value = gas_price
-        if self._gas_price_value is None:
+        expiration_ns, gas_price = self._gas_price_cache
+        if time.monotonic_ns() >= expiration_ns:
+            # only one thread requests the mempool, other threads wait for its result
+            with self._gas_price_lock:
+                expiration_ns, gas_price = self._gas_price_cache
+                now_ns = time.monotonic_ns()
+                if now_ns >= expiration_ns:
+                    new_gas_price = self._mempool_client.get_gas_price(get_req_id_from_log())
+                    if new_gas_price is not None:
+                        gas_price = new_gas_price
+                        self._gas_price_cache = (now_ns + self._gas_price_ttl_ns, gas_price)
+
+        if gas_price is None:
             raise EthereumError(message='Failed to calculate gas price. Try again later')
-        return cast(MPGasPriceResult, self._gas_price_value)
+        return cast(MPGasPriceResult, gas_price)
 
     def neon_proxy_version(self) -> str:
         return self.neon_proxyVersion()
@@ -101,9 +201,11 @@ class NeonRpcApiWorker:
     def neon_proxyVersion() -> str:
         return 'Neon-proxy/v' + NEON_PROXY_PKG_VERSION + '-' + NEON_PROXY_REVISION
 
-    @staticmethod
-    def neon_evmVersion() -> str:
-        return 'Neon/v' + ElfParams().neon_evm_version + '-' + ElfParams().neon_evm_revision
+    def neon_evmVersion(self) -> str:
+        if self._evm_version is None:
+            elf_params = ElfParams()
+            self._evm_version = 'Neon/v' + elf_params.neon_evm_version + '-' + elf_params.neon_evm_revision
+        return self._evm_version
 
     def neon_cliVersion(self) -> str:
         return NeonCli(self._config).version()
@@ -122,13 +224,22 @@ class NeonRpcApiWorker:
     def web3_clientVersion(self) -> str:
         return self.neon_evmVersion()
 
-    @staticmethod
-    def eth_chainId() -> str:
-        return hex(ElfParams().chain_id)
+    def eth_chainId(self) -> str:
+        if self._chain_id_hex is None:
+            self._chain_id_hex = hex(ElfParams().chain_id)
+        return self._chain_id_hex
 
-    @staticmethod
-    def net_version() -> str:
-        return str(ElfParams().chain_id)
+    def net_version(self) -> str:
+        if self._net_version is None:
+            self._net_version = str(ElfParams().chain_id)
+        return self._net_version
+
+    def _reset_elf_params_cache(self) -> None:
+        self._chain_id_hex = None
+        self._net_version = None
+        self._evm_version = None
+        self._is_evm_compatible = None
+        self._evm_param_dict = None
 
     def eth_gasPrice(self) -> str:
         return hex(self._gas_price.suggested_gas_price)
@@ -137,7 +248,7 @@ class NeonRpcApiWorker:
         account = param.get('from', None)
         if account is None:
             return self.eth_gasPrice()
-        account = self._normalize_address(account, 'from-address').lower()
+        account = self._normalize_address_lower(account, 'from-address')
 
         state_tx_cnt = self._solana.get_state_tx_cnt(account)
         tx_nonce = param.get('nonce', None)
@@ -164,8 +275,7 @@ class NeonRpcApiWorker:
             elif not isinstance(value, str):
                 raise RuntimeError('bad type')
 
-            value = value.lower()
-            if not value.startswith('0x'):
+            if value[:2] not in {'0x', '0X'}:
                 raise RuntimeError('bad hex')
 
             return int(value[2:], 16)
@@ -206,11 +316,52 @@ class NeonRpcApiWorker:
         return tag == 'earliest' \
             or ((tag == '0x0' or str(tag) == '0') and self._config.use_earliest_block_if_0_passed)
 
+    def _get_cached_block(self, name: str) -> SolBlockInfo:
+        expiration_time, block = self._block_tag_cache.get(name, (0.0, None))
+        if time.monotonic() < expiration_time:
+            return block
+
+        # only one thread requests the database, other threads wait for its result
+        with self._block_tag_lock:
+            expiration_time, block = self._block_tag_cache.get(name, (0.0, None))
+            now = time.monotonic()
+            if now < expiration_time:
+                return block
+
+            if name == 'latest':
+                block = self._db.get_latest_block()
+            elif name == 'finalized':
+                block = self._db.get_finalized_block()
+            else:
+                block = self._db.get_starting_block()
+
+            self._block_tag_cache[name] = (now + self._block_tag_cache_ttl_sec, block)
+            return block
+
+    def _get_cached_block_slot(self, name: str) -> int:
+        expiration_time, block_slot = self._block_slot_cache.get(name, (0.0, 0))
+        if time.monotonic() < expiration_time:
+            return block_slot
+
+        with self._block_tag_lock:
+            expiration_time, block_slot = self._block_slot_cache.get(name, (0.0, 0))
+            now = time.monotonic()
+            if now < expiration_time:
+                return block_slot
+
+            if name == 'latest':
+                block_slot = self._db.get_latest_block_slot()
+            else:
+                block_slot = self._db.get_finalized_block_slot()
+
+            self._block_slot_cache[name] = (now + self._block_tag_cache_ttl_sec, block_slot)
+            return block_slot
+
     def _process_block_tag(self, tag: Union[str, int]) -> SolBlockInfo:
         if tag == 'latest':
-            block = self._db.get_latest_block()
+            block = self._get_cached_block('latest')
         elif tag == 'pending':
-            latest_block = self._db.get_latest_block()
+            latest_block = self._get_cached_block('latest')
             block = SolBlockInfo(
                 block_slot=latest_block.block_slot + 1,
                 block_time=latest_block.block_time,
@@ -218,9 +369,9 @@ class NeonRpcApiWorker:
                 parent_block_slot=latest_block.block_slot
             )
         elif tag in {'finalized', 'safe'}:
-            block = self._db.get_finalized_block()
+            block = self._get_cached_block('finalized')
         elif self._should_return_starting_block(tag):
-            block = self._db.get_starting_block()
+            block = self._get_cached_block('earliest')
         elif isinstance(tag, str):
             try:
                 block = SolBlockInfo(block_slot=int(tag.strip(), 16))
@@ -242,7 +393,7 @@ class NeonRpcApiWorker:
             assert len(tag) == 66
             assert tag[:2] == '0x'
 
-            int(tag[2:], 16)
+            assert len(bytes.fromhex(tag[2:])) == 32
             return tag
         except (Exception,):
             raise InvalidParamError(message='transaction-id is not hex')
@@ -252,7 +403,6 @@ class NeonRpcApiWorker:
             if isinstance(tag, int):
                 pass
             elif isinstance(tag, str):
-                tag.strip().lower()
                 if tag in {'latest', 'pending', 'earliest', 'finalized', 'safe'}:
                     return
 
@@ -279,16 +429,30 @@ class NeonRpcApiWorker:
             raise InvalidParamError(message=f'invalid block tag {tag}')
 
     @staticmethod
-    def _normalize_address(raw_address: str, address_type='address') -> str:
+    def _normalize_address_lower(raw_address: str, address_type='address') -> str:
+        """Validates the address and returns it in the lower case, without calculation of the checksum"""
         try:
+            # fast path for the usual input without spaces:
+            #   40 chars are decoded into 20 bytes only if all of them are hex digits
+            if (type(raw_address) is str) and (len(raw_address) == 42) and (raw_address[:2] == '0x'):
+                if len(bytes.fromhex(raw_address[2:])) == 20:
+                    return raw_address.lower()
+
             address = raw_address.strip().lower()
+            assert len(address) == 42
             assert address[:2] == '0x'
-            address = address[2:]
 
-            bin_address = bytes.fromhex(address)
-            assert len(bin_address) == 20
+            # bytes.fromhex() skips spaces, so check the decoded length too
+            assert len(bytes.fromhex(address[2:])) == 20
+            return address
+        except (Exception,):
+            raise InvalidParamError(message=f'bad {address_type}: {raw_address}')
 
-            return eth_utils.to_checksum_address(address)
+    @staticmethod
+    def _normalize_address(raw_address: str, address_type='address') -> str:
+        address = NeonRpcApiWorker._normalize_address_lower(raw_address, address_type)
+        try:
+            return _to_checksum_address(address[2:])
         except (Exception,):
             raise InvalidParamError(message=f'bad {address_type}: {raw_address}')
 
@@ -302,7 +466,7 @@ class NeonRpcApiWorker:
         return block
 
     def eth_blockNumber(self) -> str:
-        slot = self._db.get_latest_block_slot()
+        slot = self._get_cached_block_slot('latest')
         return hex(slot)
 
     def eth_getBalance(self, account: str, tag: Union[int, str]) -> str:
@@ -341,14 +505,15 @@ class NeonRpcApiWorker:
         try:
             assert isinstance(raw_topic, str)
 
-            topic = raw_topic.strip().lower()
-            assert topic[:2] == '0x'
-            topic = topic[2:]
+            # the usual case: clients send 0x-prefixed 64 hex digits without spaces
+            topic = raw_topic if len(raw_topic) == 66 else raw_topic.strip()
+            assert topic[:2] in {'0x', '0X'}
 
-            bin_topic = bytes.fromhex(topic)
+            # bytes.fromhex() accepts both cases, and bytes.hex() returns the lower case
+            bin_topic = bytes.fromhex(topic[2:])
             assert len(bin_topic) == 32
 
-            return '0x' + bin_topic.hex().lower()
+            return '0x' + bin_topic.hex()
         except (Exception,):
             raise InvalidParamError(message=f'bad topic {raw_topic}')
 
@@ -373,11 +538,11 @@ class NeonRpcApiWorker:
 
         if obj.get('address', None) is not None:
             raw_address_list = obj['address']
+            normalize_address = self._normalize_address_lower
             if isinstance(raw_address_list, str):
-                address_list = [self._normalize_address(raw_address_list).lower()]
+                address_list = [normalize_address(raw_address_list)]
             elif isinstance(raw_address_list, list):
-                for raw_address in raw_address_list:
-                    address_list.append(self._normalize_address(raw_address).lower())
+                address_list = [normalize_address(raw_address) for raw_address in raw_address_list]
             else:
                 raise InvalidParamError(message=f'bad address {raw_address_list}')
 
@@ -389,14 +554,15 @@ class NeonRpcApiWorker:
             if not isinstance(raw_topic_list, list):
                 raise InvalidParamError(message=f'bad topics {raw_topic_list}')
 
+            normalize_topic = self._normalize_topic
             for raw_topic in raw_topic_list:
                 if isinstance(raw_topic, list):
-                    item_list = [self._normalize_topic(raw_item) for raw_item in raw_topic if raw_item is not None]
+                    item_list = [normalize_topic(raw_item) for raw_item in raw_topic if raw_item is not None]
                     topic_list.append(item_list)
                 elif raw_topic is None:
                     topic_list.append(list())
                 else:
-                    topic_list.append([self._normalize_topic(raw_topic)])
+                    topic_list.append([normalize_topic(raw_topic)])
 
         return self._db.get_log_list(from_block, to_block, address_list, topic_list)
 
@@ -407,43 +573,24 @@ class NeonRpcApiWorker:
             if (not full) and log_rec.get('neonIsHidden', False):
                 continue
 
-            new_log_rec: Dict[str, Any] = {
-                'removed': False,
-            }
+            if full:
+                new_log_rec: Dict[str, Any] = {'removed': False, **log_rec}
+                if 'neonEventType' in new_log_rec:
+                    new_log_rec['neonEventType'] = self._decode_event_type(new_log_rec['neonEventType'])
+            else:
+                new_log_rec = {'removed': False}
+                new_log_rec.update((key, value) for key, value in log_rec.items() if not key.startswith('neon'))
 
-            for key, value in log_rec.items():
-                if (key == 'data') and (not len(value)):
-                    new_log_rec[key] = '0x'
-                elif full and (key == 'neonEventType'):
-                    new_log_rec[key] = self._decode_event_type(value)
-                elif full or (key[:4] != 'neon'):
-                    new_log_rec[key] = value
+            data = new_log_rec.get('data', None)
+            if (data is not None) and (not len(data)):
+                new_log_rec['data'] = '0x'
 
             filtered_log_list.append(new_log_rec)
         return filtered_log_list
 
     @staticmethod
     def _decode_event_type(event_type: int) -> Union[str, int]:
-        event_type_dict: Dict[int, str] = {
-            1: 'LOG',
-            101: 'ENTER CALL',
-            102: 'ENTER CALL CODE',
-            103: 'ENTER STATICCALL',
-            104: 'ENTER DELEGATECALL',
-            105: 'ENTER CREATE',
-            106: 'ENTER CREATE2',
-            201: 'EXIT STOP',
-            202: 'EXIT RETURN',
-            203: 'EXIT SELFDESTRUCT',
-            204: 'EXIT REVERT',
-            300: 'RETURN',
-            301: 'CANCEL'
-        }
-
-        value = event_type_dict.get(event_type, None)
-        if value is None:
-            return event_type
-        return value
+        return _EVENT_TYPE_NAME_DICT.get(event_type, event_type)
 
     def eth_getLogs(self, obj: Dict[str, Any]) -> List[Dict[str, Any]]:
         log_list = self._get_log_list(obj)
@@ -462,38 +609,38 @@ class NeonRpcApiWorker:
         sig_list = list()
         total_gas_used = 0
         if skip_transaction:
-            tx_list = list()
-        else:
-            tx_list = self._db.get_tx_list_by_block_slot(block.block_slot)
+            pass
 
-        for tx in tx_list:
-            total_gas_used = max(tx.neon_tx_res.sum_gas_used, total_gas_used)
+        elif full:
+            for tx in self._db.get_tx_list_by_block_slot(block.block_slot):
+                total_gas_used = max(tx.neon_tx_res.sum_gas_used, total_gas_used)
+                sig_list.append(self._get_transaction(tx))
 
-            if full:
-                receipt = self._get_transaction(tx)
-                sig_list.append(receipt)
-            else:
-                sig_list.append(tx.neon_tx.sig)
+        else:
+            # only signatures are required -> don't read and decode the whole receipts
+            for neon_sig, sum_gas_used in self._db.get_tx_sig_and_gas_list_by_block_slot(block.block_slot):
+                total_gas_used = max(sum_gas_used, total_gas_used)
+                sig_list.append(neon_sig)
 
         # by default - maximum BPF cycles in Solana block
         max_gas_used = max(48_000_000, total_gas_used)
 
         result = {
-            "logsBloom": '0x' + '0' * 512,
-            "transactionsRoot": '0x' + '0' * 63 + '1',
-            "receiptsRoot": '0x' + '0' * 63 + '1',
-            "stateRoot": '0x' + '0' * 63 + '1',
+            "logsBloom": _EMPTY_LOGS_BLOOM,
+            "transactionsRoot": _EMPTY_ROOT,
+            "receiptsRoot": _EMPTY_ROOT,
+            "stateRoot": _EMPTY_ROOT,
 
 
             "uncles": [],
-            "sha3Uncles": '0x1dcc4de8dec75d7aab85b567b6ccd41ad312451b948a7413f0a142fd40d49347',
+            "sha3Uncles": _EMPTY_UNCLES_HASH,
 
             "difficulty": '0x0',
             "totalDifficulty": None,
             "extraData": '0x',
-            "miner": '0x' + '0' * 40,
-            "nonce": '0x0000000000000000',
-            "mixHash": '0x' + '0' * 63 + '1',
+            "miner": _ZERO_ADDRESS,
+            "nonce": _ZERO_BLOCK_NONCE,
+            "mixHash": _EMPTY_ROOT,
             "size": '0x' + '1',
 
             "gasLimit": hex(max_gas_used),
@@ -510,18 +657,38 @@ class NeonRpcApiWorker:
         """
         Retrieves storage data by given position
         Currently supports only 'latest' block
+        neon-cli doesn't use the block tag, so the values are cached by (account, position) for one Solana slot,
+          the result can be older than the actual state by this period
         """
 
         self._validate_block_tag(tag)
         account = self._normalize_address(account)
 
         try:
+            # each call of neon-cli starts a new process -> reuse the value read in the same Solana slot
+            key = (account, str(position))
+            with self._storage_cache_lock:
+                expiration_time, value = self._storage_cache.get(key, (0.0, ''))
+            if time.monotonic() < expiration_time:
+                return value
+
             value = NeonCli(self._config).call('get-storage-at', account, position)
-            return '0x' + (value or 64 * '0')
+            value = '0x' + (value or 64 * '0')
+
+            self._add_storage_cache_value(key, value)
+            return value
         except (Exception,):
             # LOG.error(f"eth_getStorageAt: Neon-cli failed to execute: {err}")
             return '0x' + 64 * '0'
 
+    def _add_storage_cache_value(self, key: Tuple[str, str], value: str) -> None:
+        with self._storage_cache_lock:
+            # re-insert the key to move it to the end of the insertion order
+            self._storage_cache.pop(key, None)
+            while len(self._storage_cache) >= self._storage_cache_max_size:
+                self._storage_cache.pop(next(iter(self._storage_cache)))
+            self._storage_cache[key] = (time.monotonic() + self._storage_cache_ttl_sec, value)
+
     def _get_block_by_hash(self, block_hash: str) -> SolBlockInfo:
         try:
             block_hash = block_hash.strip().lower()
@@ -612,32 +779,35 @@ class NeonRpcApiWorker:
 
     def eth_getTransactionCount(self, account: str, tag: Union[str, int]) -> str:
         self._validate_block_tag(tag)
-        account = self._normalize_address(account).lower()
+        account = self._normalize_address_lower(account)
 
         try:
             LOG.debug(f'Get transaction count. Account: {account}, tag: {tag}')
 
             pending_tx_nonce: Optional[int] = None
-            commitment = SolCommit.Confirmed
-            req_id = get_req_id_from_log()
 
-            if tag == 'pending':
-                commitment = SolCommit.Processed
+            if tag in {'pending', 'latest'}:
+                # the mempool and Solana requests don't depend on each other -> send them at the same time
+                tx_cnt_future = self._solana_executor.submit(
+                    self._solana.get_state_tx_cnt, account, SolCommit.Processed
+                )
+                req_id = get_req_id_from_log()
 
-                pending_tx_nonce = self._mempool_client.get_pending_tx_nonce(req_id=req_id, sender=account)
-                LOG.debug(f'Pending tx count for: {account} - is: {pending_tx_nonce}')
-            elif tag == 'latest':
-                commitment = SolCommit.Processed
+                if tag == 'pending':
+                    pending_tx_nonce = self._mempool_client.get_pending_tx_nonce(req_id=req_id, sender=account)
+                    LOG.debug(f'Pending tx count for: {account} - is: {pending_tx_nonce}')
+                else:
+                    pending_tx_nonce = self._mempool_client.get_mempool_tx_nonce(req_id=req_id, sender=account)
+                    LOG.debug(f'Mempool tx count for: {account} - is: {pending_tx_nonce}')
 
-                pending_tx_nonce = self._mempool_client.get_mempool_tx_nonce(req_id=req_id, sender=account)
-                LOG.debug(f'Mempool tx count for: {account} - is: {pending_tx_nonce}')
-            elif tag in {'finalized', 'safe'}:
-                commitment = SolCommit.Finalized
+                tx_cnt = tx_cnt_future.result()
+            else:
+                commitment = SolCommit.Finalized if tag in {'finalized', 'safe'} else SolCommit.Confirmed
+                tx_cnt = self._solana.get_state_tx_cnt(account, commitment)
 
             if pending_tx_nonce is None:
                 pending_tx_nonce = 0
 
-            tx_cnt = self._solana.get_state_tx_cnt(account, commitment)
             tx_count = max(tx_cnt, pending_tx_nonce)
 
             return hex(tx_count)
@@ -661,7 +831,7 @@ class NeonRpcApiWorker:
             "contractAddress": tx.neon_tx.contract,
             "logs": log_list,
             "status": hex(tx.neon_tx_res.status),
-            "logsBloom": "0x" + '0' * 512
+            "logsBloom": _EMPTY_LOGS_BLOOM
         }
 
         if full:
@@ -680,13 +850,13 @@ class NeonRpcApiWorker:
         receipt['solanaTransactions'] = result_tx_list
         receipt['neonCosts'] = result_cost_list
 
-        sol_ix_list: List[SolNeonIxReceiptShortInfo] = self._db.get_sol_ix_info_list_by_neon_sig(tx.neon_tx.sig)
+        sol_ix_list, sol_tx_cost_list = self._db.get_sol_ix_info_and_cost_list_by_neon_sig(tx.neon_tx.sig)
         if not len(sol_ix_list):
             LOG.warning(f'Cannot find Solana txs for the Neon tx {tx.neon_tx.sig}')
             return
 
-        sol_tx_cost_dict: Dict[str, SolTxCostInfo] = self._get_sol_tx_cost_dict(sol_ix_list)
-        full_log_dict: Dict[str, List[Dict[str, Any]]] = self._get_full_log_dict(tx)
+        sol_tx_cost_dict: Dict[str, SolTxCostInfo] = {tx_cost.sol_sig: tx_cost for tx_cost in sol_tx_cost_list}
+        full_log_dict: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = self._get_full_log_dict(tx)
 
         sol_sig = ''
         op_cost = OpCostInfo()
@@ -697,11 +867,13 @@ class NeonRpcApiWorker:
             if ix.sol_sig != sol_sig:
                 sol_sig = ix.sol_sig
                 tx_cost: Optional[SolTxCostInfo] = sol_tx_cost_dict.get(sol_sig, None)
-                op_cost: OpCostInfo = result_cost_dict.setdefault(tx_cost.operator, OpCostInfo())
 
                 if tx_cost is None:
                     LOG.warning(f'Cannot find the cost for the Solana tx {ix.block_slot}{sol_sig}')
+                    # the operator is unknown, so the income isn't included into the operator costs
+                    op_cost = OpCostInfo()
                 else:
+                    op_cost = result_cost_dict.setdefault(tx_cost.operator, OpCostInfo())
                     op_cost.sol_spent += tx_cost.sol_spent
 
                 result_ix_list: List[Dict[str, Any]] = list()
@@ -716,7 +888,7 @@ class NeonRpcApiWorker:
 
             neon_income = ix.neon_gas_used * tx.neon_tx.gas_price
             op_cost.neon_income += neon_income
-            log_list_key = ':'.join([sol_sig, str(ix.idx), str(ix.inner_idx)])
+            log_list_key = (sol_sig, ix.idx, ix.inner_idx)
 
             result_ix_list.append({
                 'solanaInstructionIndex': ix.idx,
@@ -726,7 +898,7 @@ class NeonRpcApiWorker:
                 'svmCyclesLimit': ix.max_bpf_cycle_cnt,
                 'svmCyclesUsed ': ix.used_bpf_cycle_cnt,
                 'neonInstructionCode': hex(ix.ix_code),
-                'neonInstructionName': EvmIxCodeName().get(ix.ix_code),
+                'neonInstructionName': get_ix_code_name(ix.ix_code),
                 'neonStepLimit': ix.neon_step_cnt if ix.neon_step_cnt > 0 else None,
                 'neonAlanIncome': neon_income,
                 'neonGasUsed': ix.neon_gas_used,
@@ -742,25 +914,14 @@ class NeonRpcApiWorker:
             for op, cost in result_cost_dict.items()
         ])
 
-    def _get_sol_tx_cost_dict(self, sol_ix_list: List[SolNeonIxReceiptShortInfo]) -> Dict[str, SolTxCostInfo]:
-        sol_sig_list: List[str] = [ix_info.sol_sig for ix_info in sol_ix_list]
-        sol_tx_cost_list: List[SolTxCostInfo] = self._db.get_cost_list_by_sol_sig_list(sol_sig_list)
-        sol_tx_cost_dict: Dict[str, SolTxCostInfo] = {tx_cost.sol_sig: tx_cost for tx_cost in sol_tx_cost_list}
-        return sol_tx_cost_dict
-
-    def _get_full_log_dict(self, tx: NeonTxReceiptInfo) -> Dict[str, List[Dict[str, Any]]]:
-        remove_neon_key_list = ['neonSolHash', 'neonIxIdx', 'neonInnerIxIdx']
-        remove_eth_key_list = ['removed', 'transactionHash', 'transactionIndex', 'blockHash', 'blockNumber']
-
+    def _get_full_log_dict(self, tx: NeonTxReceiptInfo) -> Dict[Tuple[str, int, int], List[Dict[str, Any]]]:
         full_log_list: List[Dict[str, Any]] = self._filter_log_list(tx.neon_tx_res.log_list, True)
-        full_log_dict: Dict[str, List[Dict[str, Any]]] = dict()
+        full_log_dict: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = dict()
         for log_rec in full_log_list:
-            log_list_key = ':'.join([log_rec['neonSolHash'], str(log_rec['neonIxIdx']), str(log_rec['neonInnerIxIdx'])])
-            for key in remove_neon_key_list:
-                log_rec.pop(key, None)
-            if 'transactionLogIndex' not in log_rec:
-                for key in remove_eth_key_list:
-                    log_rec.pop(key, None)
+            log_list_key = (log_rec['neonSolHash'], log_rec['neonIxIdx'], log_rec['neonInnerIxIdx'])
+            # events (without the transactionLogIndex) don't have the Ethereum fields
+            remove_key_set = _FULL_LOG_NEON_KEY_SET if 'transactionLogIndex' in log_rec else _FULL_LOG_EVENT_KEY_SET
+            log_rec = {key: value for key, value in log_rec.items() if key not in remove_key_set}
 
             full_log_dict.setdefault(log_list_key, list()).append(log_rec)
         return full_log_dict
@@ -853,12 +1014,18 @@ class NeonRpcApiWorker:
 
     def eth_sendRawTransaction(self, raw_tx: str) -> str:
         neon_tx: NeonTx = self._decode_neon_raw_tx(raw_tx)
+        return self._send_neon_tx(neon_tx)
+
+    def _send_neon_tx(self, neon_tx: NeonTx) -> str:
         try:
+            # the sender account doesn't depend on the Indexer DB and the mempool -> read it at the same time
+            neon_acct_future = self._solana_executor.submit(self._solana.get_neon_account_info, neon_tx.sender)
+
             # validate that tx was executed 2 times (second in the except section)
-            if self._is_neon_tx_exist(neon_tx):
+            if self._is_neon_tx_exist(neon_tx, neon_acct_future):
                 return neon_tx.hex_tx_sig
 
-            neon_tx_exec_cfg: NeonTxExecCfg = self._get_neon_tx_exec_cfg(neon_tx)
+            neon_tx_exec_cfg: NeonTxExecCfg = self._get_neon_tx_exec_cfg(neon_tx, neon_acct_future.result())
 
             result: MPTxSendResult = self._mempool_client.send_raw_transaction(
                 req_id=get_req_id_from_log(), neon_tx=neon_tx, neon_tx_exec_cfg=neon_tx_exec_cfg
@@ -884,10 +1051,13 @@ class NeonRpcApiWorker:
     @staticmethod
     def _decode_neon_raw_tx(raw_tx: str) -> NeonTx:
         try:
-            neon_tx = NeonTx.from_string(bytearray.fromhex(raw_tx[2:]))
+            neon_tx = NeonTx.from_string(bytes.fromhex(raw_tx[2:]))
         except (Exception,):
             raise InvalidParamError(message='wrong transaction format')
 
+        if not LOG.isEnabledFor(logging.DEBUG):
+            return neon_tx
+
         def _readable_tx(tx: NeonTx) -> Dict[str, Any]:
             fmt_tx = dict()
             for k, v in tx.as_dict().items():
@@ -900,7 +1070,7 @@ class NeonRpcApiWorker:
         LOG.debug(f'sendRawTransaction {neon_tx.hex_tx_sig}: {_readable_tx(neon_tx)}')
         return neon_tx
 
-    def _is_neon_tx_exist(self, neon_tx: NeonTx) -> bool:
+    def _is_neon_tx_exist(self, neon_tx: NeonTx, neon_acct_future: Optional[Future] = None) -> bool:
         # only if tx was indexed by the Indexer
         neon_tx_receipt = self._db.get_tx_by_neon_sig(neon_tx.hex_tx_sig)
         if neon_tx_receipt is not None:
@@ -911,16 +1081,23 @@ class NeonRpcApiWorker:
         if neon_tx_or_error is not None:
             return True
 
-        NeonTxNonceValidator(self._solana, neon_tx).precheck()
+        state_tx_cnt: Optional[int] = None
+        if neon_acct_future is not None:
+            neon_account_info: Optional[NeonAccountInfo] = neon_acct_future.result()
+            state_tx_cnt = neon_account_info.tx_count if neon_account_info is not None else 0
+
+        NeonTxNonceValidator(self._solana, neon_tx).precheck(state_tx_cnt)
         return False
 
-    def _get_neon_tx_exec_cfg(self, neon_tx: NeonTx) -> NeonTxExecCfg:
+    def _get_neon_tx_exec_cfg(self, neon_tx: NeonTx, neon_account_info: Optional[NeonAccountInfo]) -> NeonTxExecCfg:
         gas_less_permit = False
         if neon_tx.gasPrice == 0:
             gas_less_permit = self._has_gas_less_tx_permit(neon_tx.hex_sender, neon_tx.nonce, neon_tx.gasLimit)
 
         min_gas_price = self._gas_price.min_gas_price
-        neon_tx_validator = NeonTxValidator(self._config, self._solana, neon_tx, gas_less_permit, min_gas_price)
+        neon_tx_validator = NeonTxValidator(
+            self._config, self._solana, neon_tx, neon_account_info, gas_less_permit, min_gas_price
+        )
         neon_tx_exec_cfg = neon_tx_validator.precheck()
 
         return neon_tx_exec_cfg
@@ -934,12 +1111,11 @@ class NeonRpcApiWorker:
             raise EthereumError(message=f'invalid transaction index {tx_idx}')
 
         if block.is_empty():
-            block = self._db.get_block_by_slot(block.block_slot)
-            if block.is_empty():
-                LOG.debug(f"Not found block by slot {block.block_slot}")
-                return None
+            # the block isn't read yet -> check that it is active in the same request with the tx
+            neon_tx_receipt = self._db.get_tx_by_block_slot_tx_idx(block.block_slot, tx_idx, is_active_block=True)
+        else:
+            neon_tx_receipt = self._db.get_tx_by_block_slot_tx_idx(block.block_slot, tx_idx)
 
-        neon_tx_receipt = self._db.get_tx_by_block_slot_tx_idx(block.block_slot, tx_idx)
         if neon_tx_receipt is None:
             LOG.debug("Not found receipt")
             return None
@@ -959,22 +1135,15 @@ class NeonRpcApiWorker:
         block = self._get_block_by_hash(block_hash)
         if block.is_empty():
             return hex(0)
-        if block.is_empty():
-            block = self._db.get_block_by_slot(block.block_slot)
-            if block.is_empty():
-                LOG.debug(f"Not found block by slot {block.block_slot}")
-                return hex(0)
 
-        tx_list = self._db.get_tx_list_by_block_slot(block.block_slot)
-        return hex(len(tx_list))
+        return hex(self._db.get_tx_cnt_by_block_slot(block.block_slot))
 
     def eth_getBlockTransactionCountByNumber(self, tag: str) -> str:
         block = self._get_full_block_by_number(tag)
         if block.is_empty():
             return hex(0)
 
-        tx_list = self._db.get_tx_list_by_block_slot(block.block_slot)
-        return hex(len(tx_list))
+        return hex(self._db.get_tx_cnt_by_block_slot(block.block_slot))
 
     @staticmethod
     def eth_accounts() -> [str]:
@@ -993,10 +1162,14 @@ class NeonRpcApiWorker:
         if not account:
             raise EthereumError(message='unknown account')
 
-        message = str.encode(f'\x19Ethereum Signed Message:\n{len(data)}') + data
-        return str(account.private.sign_msg(message))
+        message = b''.join((b'\x19Ethereum Signed Message:\n', str(len(data)).encode(), data))
+        return account.private.sign_msg(message).to_hex()
 
     def eth_signTransaction(self, tx: Dict[str, Any]) -> Dict[str, Any]:
+        result, _ = self._sign_transaction(tx)
+        return result
+
+    def _sign_transaction(self, tx: Dict[str, Any]) -> Tuple[Dict[str, Any], NeonTx]:
         if 'from' not in tx:
             raise InvalidParamError(message='no sender in transaction')
 
@@ -1015,12 +1188,12 @@ class NeonRpcApiWorker:
             tx['nonce'] = self.eth_getTransactionCount(sender, 'pending')
 
         if 'chainId' not in tx:
-            tx['chainId'] = hex(ElfParams().chain_id)
+            tx['chainId'] = self.eth_chainId()
 
         try:
             signed_tx = NeonAccount().sign_transaction(tx, account.private)
             raw_tx = signed_tx.rawTransaction.hex()
-            neon_tx = NeonTx.from_string(bytearray.fromhex(raw_tx[2:]))
+            neon_tx = NeonTx.from_string(bytes(signed_tx.rawTransaction))
 
             tx.update({
                 'from': neon_tx.hex_sender,
@@ -1031,17 +1204,19 @@ class NeonRpcApiWorker:
                 'v': hex(neon_tx.v)
             })
 
-            return {
+            result = {
                 'raw': raw_tx,
                 'tx': tx
             }
+            return result, neon_tx
         except BaseException as exc:
             LOG.error('Failed on sign transaction.', exc_info=exc)
             raise InvalidParamError(message='bad transaction')
 
     def eth_sendTransaction(self, tx: Dict[str, Any]) -> str:
-        tx = self.eth_signTransaction(tx)
-        return self.eth_sendRawTransaction(tx['raw'])
+        # the signed tx is already decoded -> don't decode it again from the raw string
+        _, neon_tx = self._sign_transaction(tx)
+        return self._send_neon_tx(neon_tx)
 
     @staticmethod
     def web3_sha3(data: str) -> str:
@@ -1067,7 +1242,7 @@ class NeonRpcApiWorker:
     def eth_syncing(self) -> Union[bool, dict]:
         try:
             slots_behind = self._solana.get_slots_behind()
-            latest_slot = self._db.get_latest_block_slot()
+            latest_slot = self._get_cached_block_slot('latest')
             first_slot = self._db.get_starting_block_slot()
 
             LOG.debug(f'slots_behind: {slots_behind}, latest_slot: {latest_slot}, first_slot: {first_slot}')
@@ -1106,54 +1281,56 @@ class NeonRpcApiWorker:
         """Executes emulator with given transaction"""
         LOG.debug(f"Call neon_emulate: {raw_signed_tx}")
 
-        neon_tx = NeonTx.from_string(bytearray.fromhex(raw_signed_tx))
+        neon_tx = NeonTx.from_string(bytes.fromhex(raw_signed_tx))
         emulation_result = call_tx_emulated(self._config, neon_tx)
         return emulation_result
 
     def neon_finalizedBlockNumber(self) -> str:
-        slot = self._db.get_finalized_block_slot()
+        slot = self._get_cached_block_slot('finalized')
         return hex(slot)
 
     def neon_getEvmParams(self) -> Dict[str, str]:
         """Returns map of Neon-EVM parameters"""
-        elf_param_dict = ElfParams().elf_param_dict
-        elf_param_dict['NEON_EVM_ID'] = str(self._config.evm_program_id)
-        return elf_param_dict
+        if self._evm_param_dict is None:
+            # don't modify the dict of ElfParams, it is compared with the new params from the mempool
+            self._evm_param_dict = {**ElfParams().elf_param_dict, 'NEON_EVM_ID': str(self._config.evm_program_id)}
+        return self._evm_param_dict
+
+    def _refresh_elf_params(self) -> None:
+        # only one thread requests the mempool, other threads wait for its result
+        with self._elf_params_lock:
+            now = time.monotonic()
+            if now - self._last_elf_params_time < self._elf_params_ttl_sec:
+                return
+
+            elf_param_dict = self._mempool_client.get_elf_param_dict(get_req_id_from_log())
+            if elf_param_dict is None:
+                raise EthereumError(message='Failed to read Neon EVM params from Solana cluster. Try again later')
+
+            elf_params = ElfParams()
+            if elf_param_dict != elf_params.elf_param_dict:
+                elf_params.set_elf_param_dict(elf_param_dict)
+                self._reset_elf_params_cache()
+            self._last_elf_params_time = now
 
     def is_allowed_api(self, method_name: str) -> bool:
-        for prefix in ('eth_', 'net_', 'web3_', 'neon_'):
-            if method_name.startswith(prefix):
-                break
-        else:
+        if not method_name.startswith(_ALLOWED_METHOD_PREFIX_TUPLE):
             return False
 
         if method_name == 'neon_proxyVersion':
             return True
 
-        now = math.ceil(time.time())
-        elf_params = ElfParams()
-        if self._last_elf_params_time != now:
-            elf_param_dict = self._mempool_client.get_elf_param_dict(get_req_id_from_log())
-            if elf_param_dict is None:
-                raise EthereumError(message='Failed to read Neon EVM params from Solana cluster. Try again later')
-            elf_params.set_elf_param_dict(elf_param_dict)
-
-        always_allowed_method_set = {
-            "eth_chainId",
-            "neon_cliVersion",
-            "neon_evmVersion",
-            "neon_solanaVersion",
-            "neon_versions",
-            "neon_getEvmParams",
-            "net_version",
-            "web3_clientVersion"
-        }
+        if time.monotonic() - self._last_elf_params_time >= self._elf_params_ttl_sec:
+            self._refresh_elf_params()
 
-        if method_name in always_allowed_method_set:
+        elf_params = ElfParams()
+        if method_name in _ALWAYS_ALLOWED_METHOD_SET:
             if elf_params.has_params():
                 return True
 
-        if not elf_params.is_evm_compatible(NEON_PROXY_PKG_VERSION):
+        if self._is_evm_compatible is None:
+            self._is_evm_compatible = elf_params.is_evm_compatible(NEON_PROXY_PKG_VERSION)
+        if not self._is_evm_compatible:
             raise EthereumError(
                 f'Neon Proxy {self.neon_proxyVersion()} is not compatible with '
                 f'Neon EVM {self.web3_clientVersion()}'
@@ -1162,14 +1339,7 @@ class NeonRpcApiWorker:
         if method_name == 'eth_sendRawTransaction':
             return self._config.enable_send_tx_api
 
-        private_method_set = {
-            "eth_accounts",
-            "eth_sign",
-            "eth_sendTransaction",
-            "eth_signTransaction",
-        }
-
-        if method_name in private_method_set:
+        if method_name in _PRIVATE_METHOD_SET:
             if (not self._config.enable_send_tx_api) or (not self._config.enable_private_api):
                 return False
 
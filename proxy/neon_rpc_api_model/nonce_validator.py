@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from ..common_neon.errors import EthereumError, NonceTooLowError
 from ..common_neon.utils.eth_proto import NeonTx
 from ..common_neon.solana_interactor import SolInteractor
@@ -12,9 +14,10 @@ class NeonTxNonceValidator:
         self._solana = solana
         self._tx = tx
 
-    def precheck(self) -> None:
+    def precheck(self, state_tx_cnt: Optional[int] = None) -> None:
         tx_nonce = int(self._tx.nonce)
-        state_tx_cnt = self._solana.get_state_tx_cnt(self._tx.sender)
+        if state_tx_cnt is None:
+            state_tx_cnt = self._solana.get_state_tx_cnt(self._tx.sender)
         if self.max_u64 in (state_tx_cnt, tx_nonce):
             sender = self._tx.hex_sender
             raise EthereumError(
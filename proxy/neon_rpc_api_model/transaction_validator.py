@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..common_neon.config import Config
 from ..common_neon.data import NeonTxExecCfg, NeonEmulatedResult
 from ..common_neon.elf_params import ElfParams
 from ..common_neon.emulator_interactor import call_tx_emulated, check_emulated_exit_status
 from ..common_neon.errors import EthereumError, NonceTooLowError
+from ..common_neon.layouts import NeonAccountInfo
 from ..common_neon.utils.eth_proto import NeonTx
 from ..common_neon.solana_interactor import SolInteractor
 from ..common_neon.solana_tx_error_parser import SolTxErrorParser
@@ -18,12 +19,14 @@ class NeonTxValidator:
     _max_u64 = 2 ** 64 - 1
     _max_u256 = 2 ** 256 - 1
 
-    def __init__(self, config: Config, solana: SolInteractor, tx: NeonTx, gas_less_permit: bool, min_gas_price: int):
+    def __init__(self, config: Config, solana: SolInteractor, tx: NeonTx,
+                 neon_account_info: Optional[NeonAccountInfo],
+                 gas_less_permit: bool, min_gas_price: int):
         self._config = config
         self._solana = solana
         self._tx = tx
 
-        self._neon_account_info = solana.get_neon_account_info(self._tx.sender)
+        self._neon_account_info = neon_account_info
 
         self._has_gas_less_permit = gas_less_permit
         self._min_gas_price = min_gas_price
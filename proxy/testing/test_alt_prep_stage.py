@@ -0,0 +1,60 @@
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from ..common_neon.errors import ALTContentError, SolanaUnavailableError
+from ..common_neon.layouts import ALTAccountInfo
+from ..common_neon.solana_alt import ALTAddress
+from ..common_neon.solana_tx import SolPubKey
+from ..mempool.neon_tx_send_strategy_base_stages import ALTNeonTxPrepStage
+
+
+class TestALTPrepStageFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._ctx = MagicMock()
+        self._ctx.alt_address_list = [ALTAddress(str(SolPubKey.new_unique()), 1, 255) for _ in range(3)]
+        self._acct_info_list = [MagicMock() for _ in self._ctx.alt_address_list]
+        self._stage = ALTNeonTxPrepStage(self._ctx)
+
+        self._actual_alt_info = MagicMock()
+        self._actual_alt_info.remove_account_key_list.return_value = True
+
+    def _from_account_info(self, acct_info):
+        idx = self._acct_info_list.index(acct_info)
+        if idx == 1:
+            raise RuntimeError('bad ALT data')
+
+        alt_acct_info = MagicMock()
+        alt_acct_info.table_account = SolPubKey.from_string(self._ctx.alt_address_list[idx].table_account)
+        alt_acct_info.account_key_list = [SolPubKey.new_unique()]
+        return alt_acct_info
+
+    @patch.object(ALTAccountInfo, 'from_account_info')
+    def test_skip_bad_alt(self, from_account_info: MagicMock):
+        from_account_info.side_effect = self._from_account_info
+        self._ctx.solana.get_account_info_list.return_value = self._acct_info_list
+
+        alt_info_list = self._stage._filter_alt_info_list(self._actual_alt_info)
+
+        self._ctx.solana.get_account_info_list.assert_called_once()
+        expected_list = [self._ctx.alt_address_list[0], self._ctx.alt_address_list[2]]
+        self.assertEqual(expected_list, [alt_info.alt_address for alt_info in alt_info_list])
+        self.assertEqual(expected_list, [alt_info.alt_address for alt_info in self._stage._alt_info_list])
+
+    def test_failed_batch_read(self):
+        self._ctx.solana.get_account_info_list.side_effect = SolanaUnavailableError('no connection')
+
+        alt_info_list = self._stage._filter_alt_info_list(self._actual_alt_info)
+        self.assertEqual(0, len(alt_info_list))
+        self.assertEqual(0, len(self._stage._alt_info_list))
+
+    def test_not_read_alt(self):
+        # on a request error, the results are shorter than the list of accounts
+        self._ctx.solana.get_account_info_list.return_value = self._acct_info_list[:1]
+
+        with self.assertRaises(ALTContentError):
+            self._stage._filter_alt_info_list(self._actual_alt_info)
+
+
+if __name__ == '__main__':
+    unittest.main()
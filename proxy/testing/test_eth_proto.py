@@ -0,0 +1,103 @@
+import unittest
+
+import eth_utils
+import rlp
+
+from eth_account import Account as NeonAccount
+
+from ..common_neon.utils.eth_proto import NeonTx, NeonNoChainTx, rlp_encode_neon_tx
+
+
+class TestRlpEncodeNeonTx(unittest.TestCase):
+    _to_address = bytes.fromhex('ab' * 20)
+
+    def _create_neon_tx(self, **kwargs) -> NeonTx:
+        value_dict = dict(
+            nonce=1, gasPrice=10 ** 9, gasLimit=21000, toAddress=self._to_address, value=10 ** 18, callData=b'',
+            v=245022934, r=2 ** 255 + 1, s=2 ** 254 + 3
+        )
+        value_dict.update(kwargs)
+        return NeonTx(**value_dict)
+
+    def _assert_rlp_encode(self, tx: NeonTx) -> None:
+        self.assertEqual(rlp.encode(tx), rlp_encode_neon_tx(tx))
+        self.assertEqual(rlp.encode(tx), tx.rlp_msg)
+
+    def test_legacy_tx_with_chain_id(self):
+        self._assert_rlp_encode(self._create_neon_tx())
+
+    def test_tx_without_chain_id(self):
+        for v in (27, 28):
+            self._assert_rlp_encode(self._create_neon_tx(v=v))
+
+    def test_contract_creation(self):
+        self._assert_rlp_encode(self._create_neon_tx(toAddress=b'', callData=bytes.fromhex('6080604052') * 100))
+
+    def test_zero_values(self):
+        self._assert_rlp_encode(self._create_neon_tx(nonce=0, gasPrice=0, gasLimit=0, value=0, v=0, r=0, s=0))
+
+    def test_edge_values(self):
+        for value in (1, 0x7f, 0x80, 0xff, 0x100, 2 ** 64, 2 ** 256 - 1):
+            self._assert_rlp_encode(self._create_neon_tx(nonce=value, value=value))
+
+        for call_data in (b'\x00', b'\x7f', b'\x80', b'\xff', b'\x01' * 55, b'\x01' * 56, b'\x01' * 256):
+            self._assert_rlp_encode(self._create_neon_tx(callData=call_data))
+
+    def test_large_call_data(self):
+        self._assert_rlp_encode(self._create_neon_tx(callData=bytes(range(256)) * 1024))
+
+
+class TestNeonTxFromString(unittest.TestCase):
+    # eth_account accepts only checksum addresses
+    _to_address = eth_utils.to_checksum_address('0x' + 'ab' * 20)
+
+    def setUp(self) -> None:
+        self._account = NeonAccount.create()
+
+    def _sign_tx(self, **kwargs) -> bytes:
+        tx_dict = dict(nonce=3, gasPrice=10 ** 9, gas=1000000, to=self._to_address, value=1, data=b'\x12\x34')
+        tx_dict.update(kwargs)
+        if not tx_dict['to']:
+            # contract creation
+            tx_dict.pop('to')
+        signed_tx = self._account.sign_transaction(tx_dict)
+        self._tx_hash = bytes(signed_tx.hash)
+        return bytes(signed_tx.rawTransaction)
+
+    def _assert_round_trip(self, raw_tx: bytes) -> NeonTx:
+        tx = NeonTx.from_string(raw_tx)
+
+        # the memoized message is the source, and it is equal to the encoded tx
+        self.assertEqual(raw_tx, tx.rlp_msg)
+        self.assertEqual(raw_tx, rlp_encode_neon_tx(tx))
+        self.assertEqual(raw_tx, rlp.encode(tx))
+
+        self.assertEqual(self._tx_hash, tx.tx_sig)
+        self.assertEqual('0x' + self._tx_hash.hex(), tx.hex_tx_sig)
+        self.assertEqual(self._account.address.lower(), tx.hex_sender)
+        return tx
+
+    def test_tx_with_chain_id(self):
+        tx = self._assert_round_trip(self._sign_tx(chainId=245022934))
+        self.assertEqual(245022934, tx.chain_id())
+
+    def test_tx_without_chain_id(self):
+        tx = self._assert_round_trip(self._sign_tx())
+        self.assertIn(tx.v, (27, 28))
+        self.assertIsNone(tx.chain_id())
+
+    def test_contract_creation(self):
+        tx = self._assert_round_trip(self._sign_tx(chainId=245022934, to='', data=b'\x60\x80' * 10000))
+        self.assertIsNotNone(tx.contract)
+
+    def test_unsigned_tx(self):
+        nochain_tx = NeonNoChainTx(1, 10 ** 9, 21000, bytes.fromhex('ab' * 20), 0, b'')
+        tx = NeonTx.from_string(rlp.encode(nochain_tx))
+
+        # the unsigned tx is extended with zero v, r, s
+        self.assertEqual((0, 0, 0), (tx.v, tx.r, tx.s))
+        self.assertEqual(rlp.encode(tx), tx.rlp_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from typing import Any, List
+
+from unittest.mock import MagicMock
+
+from ..common_neon.solana_neon_tx_receipt import SolTxCostInfo
+from ..indexer.neon_txs_db import NeonTxsDB
+from ..indexer.solana_neon_txs_db import SolNeonTxsDB
+
+
+class TestNeonTxsDB(unittest.TestCase):
+    _block_slot = 100
+    _block_hash = '0x' + 'cd' * 32
+
+    def setUp(self) -> None:
+        self._db = MagicMock()
+        self._neon_txs_db = NeonTxsDB(self._db)
+
+    def _create_tx_value_list(self, tx_idx: int, sum_gas_used: str) -> List[Any]:
+        value_dict = {
+            'sol_sig': 'sol-sig', 'sol_ix_idx': 1, 'sol_ix_inner_idx': None,
+            'block_slot': self._block_slot, 'tx_idx': tx_idx,
+            'neon_sig': '0x' + f'{tx_idx:064x}', 'tx_type': 0,
+            'from_addr': '0x' + 'ab' * 20, 'nonce': '0x1', 'to_addr': '0x' + 'ef' * 20, 'contract': None,
+            'value': '0x', 'calldata': '0x', 'gas_price': '0x3b9aca00', 'gas_limit': '0x5208',
+            'v': '0x1b', 'r': '0x2', 's': '0x3',
+            'status': '0x1', 'is_canceled': False, 'is_completed': True,
+            'gas_used': '0x5208', 'sum_gas_used': sum_gas_used, 'logs': None
+        }
+        return [value_dict[column] for column in self._neon_txs_db._column_list] + [self._block_hash]
+
+    def test_get_tx_sig_and_gas_list_by_block_slot(self):
+        self._db.fetch_all.return_value = [('0x' + '01' * 32, '0x5208'), ('0x' + '02' * 32, '0x')]
+
+        result = self._neon_txs_db.get_tx_sig_and_gas_list_by_block_slot(self._block_slot)
+        self.assertEqual([('0x' + '01' * 32, 21000), ('0x' + '02' * 32, 0)], result)
+        self.assertEqual((self._block_slot,), self._db.fetch_all.call_args[0][1])
+
+        self._db.fetch_all.return_value = list()
+        self.assertEqual(list(), self._neon_txs_db.get_tx_sig_and_gas_list_by_block_slot(self._block_slot))
+
+    def test_get_tx_cnt_by_block_slot(self):
+        self._db.fetch_one.return_value = [5]
+        self.assertEqual(5, self._neon_txs_db.get_tx_cnt_by_block_slot(self._block_slot))
+        self.assertEqual((self._block_slot,), self._db.fetch_one.call_args[0][1])
+
+        # fetch_one() returns an empty list if there are no rows
+        self._db.fetch_one.return_value = list()
+        self.assertEqual(0, self._neon_txs_db.get_tx_cnt_by_block_slot(self._block_slot))
+
+    def test_get_tx_by_block_slot_tx_idx(self):
+        self._db.fetch_one.return_value = self._create_tx_value_list(3, '0xa410')
+
+        tx = self._neon_txs_db.get_tx_by_block_slot_tx_idx(self._block_slot, 3)
+        request, param_list = self._db.fetch_one.call_args[0]
+        self.assertEqual((self._block_slot, 3), param_list)
+        self.assertNotIn('is_active', request)
+
+        self.assertEqual('0x' + f'{3:064x}', tx.neon_tx.sig)
+        self.assertEqual(1, tx.neon_tx.nonce)
+        self.assertEqual(0, tx.neon_tx.value)
+        self.assertEqual(3, tx.neon_tx_res.tx_idx)
+        self.assertEqual(42000, tx.neon_tx_res.sum_gas_used)
+        self.assertEqual(self._block_hash, tx.neon_tx_res.block_hash)
+
+        self._neon_txs_db.get_tx_by_block_slot_tx_idx(self._block_slot, 3, is_active_block=True)
+        request, _ = self._db.fetch_one.call_args[0]
+        self.assertIn('is_active = True', request)
+        # the filter is a part of the join, before the WHERE clause
+        self.assertLess(request.index('is_active'), request.index('WHERE'))
+
+        self._db.fetch_one.return_value = list()
+        self.assertIsNone(self._neon_txs_db.get_tx_by_block_slot_tx_idx(self._block_slot, 4))
+
+
+class TestSolNeonTxsDB(unittest.TestCase):
+    _neon_sig = '0x' + 'ab' * 32
+
+    def setUp(self) -> None:
+        self._db = MagicMock()
+        self._sol_neon_txs_db = SolNeonTxsDB(self._db)
+
+    def _create_ix_value_list(self, sol_sig: str, idx: int, operator: Any, sol_spent: Any) -> List[Any]:
+        value_dict = {
+            'sol_sig': sol_sig, 'block_slot': 100, 'idx': idx, 'inner_idx': None, 'ix_code': 0x20,
+            'is_success': True, 'neon_sig': self._neon_sig, 'neon_step_cnt': 10,
+            'neon_gas_used': 5000, 'neon_total_gas_used': 5000 * (idx + 1),
+            'max_heap_size': 0, 'used_heap_size': 0, 'max_bpf_cycle_cnt': 0, 'used_bpf_cycle_cnt': 0
+        }
+        return [value_dict[column] for column in self._sol_neon_txs_db._column_list] + [operator, sol_spent]
+
+    def test_get_sol_ix_info_and_cost_list_by_neon_sig(self):
+        self._db.fetch_all.return_value = [
+            self._create_ix_value_list('sol-sig-1', 0, 'operator', 5000),
+            # the second instruction in the same Solana tx
+            self._create_ix_value_list('sol-sig-1', 1, 'operator', 5000),
+            # no cost of the Solana tx (LEFT JOIN)
+            self._create_ix_value_list('sol-sig-2', 2, None, None),
+        ]
+
+        sol_ix_list, sol_cost_list = self._sol_neon_txs_db.get_sol_ix_info_and_cost_list_by_neon_sig(self._neon_sig)
+        self.assertEqual((self._neon_sig,), self._db.fetch_all.call_args[0][1])
+
+        self.assertEqual(['sol-sig-1', 'sol-sig-1', 'sol-sig-2'], [ix.sol_sig for ix in sol_ix_list])
+        self.assertEqual([0, 1, 2], [ix.idx for ix in sol_ix_list])
+        self.assertEqual(
+            [SolTxCostInfo(sol_sig='sol-sig-1', block_slot=100, operator='operator', sol_spent=5000)],
+            sol_cost_list
+        )
+
+        self._db.fetch_all.return_value = list()
+        self.assertEqual(
+            (list(), list()),
+            self._sol_neon_txs_db.get_sol_ix_info_and_cost_list_by_neon_sig(self._neon_sig)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import threading
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+import eth_utils
+
+from ..common_neon.environment_utils import NeonCli
+from ..common_neon.errors import InvalidParamError
+from ..neon_rpc_api_model.neon_rpc_api_worker import NeonRpcApiWorker
+
+
+class TestNormalizeAddress(unittest.TestCase):
+    _address = '0x' + 'ab' * 20
+
+    def test_lower(self):
+        self.assertEqual(self._address, NeonRpcApiWorker._normalize_address_lower(self._address))
+        self.assertEqual(self._address, NeonRpcApiWorker._normalize_address_lower('0X' + 'AB' * 20))
+        self.assertEqual(self._address, NeonRpcApiWorker._normalize_address_lower(' ' + self._address + ' '))
+        # the fast path for the checksum address
+        checksum_address = eth_utils.to_checksum_address(self._address)
+        self.assertEqual(self._address, NeonRpcApiWorker._normalize_address_lower(checksum_address))
+
+    def test_checksum(self):
+        checksum_address = eth_utils.to_checksum_address(self._address)
+        self.assertEqual(checksum_address, NeonRpcApiWorker._normalize_address(self._address))
+        self.assertEqual(checksum_address, NeonRpcApiWorker._normalize_address(' ' + self._address + '\n'))
+
+    def test_bad_address(self):
+        bad_address_list = [
+            '',
+            'ab' * 21,
+            '0x' + 'ab' * 19,
+            '0x' + 'ab' * 21,
+            '0x' + 'zz' * 20,
+            '0x ' + 'ab' * 19 + ' ',
+            # 42 chars, but bytes.fromhex() skips the spaces, and the result is 19 bytes
+            '0x' + 'ab' * 9 + '  ' + 'ab' * 10,
+            '0xab ' + 'ab' * 18 + 'a ',
+            # 42 chars with the '0x' prefix, but not hex digits
+            '0x' + 'ab' * 19 + 'xy',
+            '0x' + 'ab' * 19 + 'a\n',
+        ]
+        for bad_address in bad_address_list:
+            with self.assertRaises(InvalidParamError, msg=bad_address):
+                NeonRpcApiWorker._normalize_address_lower(bad_address)
+            with self.assertRaises(InvalidParamError, msg=bad_address):
+                NeonRpcApiWorker._normalize_address(bad_address)
+
+
+class TestStorageCache(unittest.TestCase):
+    _account = '0x' + 'ab' * 20
+
+    def setUp(self) -> None:
+        # the worker without connections to Solana and the database
+        self._worker = NeonRpcApiWorker.__new__(NeonRpcApiWorker)
+        self._worker._config = MagicMock()
+        self._worker._storage_cache = dict()
+        self._worker._storage_cache_lock = threading.Lock()
+        # no expiration during the test
+        self._worker._storage_cache_ttl_sec = 60.0
+
+    @patch.object(NeonCli, 'call')
+    def test_cache_by_position(self, neon_cli_call: MagicMock):
+        neon_cli_call.return_value = '01'
+
+        # neon-cli doesn't use the block tag, so all tags share the cached value
+        for tag in ('latest', 'pending', 'finalized', '0x10', 16):
+            self.assertEqual('0x01', self._worker.eth_getStorageAt(self._account, '0x0', tag))
+        self.assertEqual(1, neon_cli_call.call_count)
+
+        # another position
+        self.assertEqual('0x01', self._worker.eth_getStorageAt(self._account, '0x1', 'latest'))
+        self.assertEqual(2, neon_cli_call.call_count)
+
+    @patch.object(NeonCli, 'call')
+    def test_expiration(self, neon_cli_call: MagicMock):
+        neon_cli_call.return_value = ''
+        self._worker._storage_cache_ttl_sec = 0.0
+
+        for _ in range(3):
+            self.assertEqual('0x' + 64 * '0', self._worker.eth_getStorageAt(self._account, '0x0', 'latest'))
+        self.assertEqual(3, neon_cli_call.call_count)
+        self.assertEqual(1, len(self._worker._storage_cache))
+
+    @patch.object(NeonCli, 'call')
+    def test_evict_oldest(self, neon_cli_call: MagicMock):
+        neon_cli_call.return_value = '01'
+        max_size = NeonRpcApiWorker._storage_cache_max_size
+
+        for position in range(max_size + 1):
+            self._worker.eth_getStorageAt(self._account, hex(position), 'latest')
+
+        self.assertEqual(max_size, len(self._worker._storage_cache))
+        self.assertEqual(max_size + 1, neon_cli_call.call_count)
+
+        # the first value is evicted, the last ones are still in the cache
+        self._worker.eth_getStorageAt(self._account, hex(max_size), 'latest')
+        self._worker.eth_getStorageAt(self._account, hex(1), 'latest')
+        self.assertEqual(max_size + 1, neon_cli_call.call_count)
+
+        self._worker.eth_getStorageAt(self._account, hex(0), 'latest')
+        self.assertEqual(max_size + 2, neon_cli_call.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()